@@ -0,0 +1,412 @@
+"""
+Code generation of specialized dump and load functions for model schema classes.
+
+A compiled dumper reads the schema fields straight off the object with `getattr` and
+inlines the serialization of common field types. Fields which cannot be compiled are
+serialized through their regular `Field.serialize` method.
+
+A compiled loader inlines type checks, `allow_none` handling and validator calls of the
+load fields for valid input. Whenever a value is missing or invalid, the field is
+deserialized again through its regular `Field.deserialize` method, so the errors are
+exactly the same as the ones of a regular load.
+"""
+import decimal
+import threading
+from collections import OrderedDict
+
+import marshmallow as ma
+from marshmallow import EXCLUDE, INCLUDE, RAISE, ValidationError, utils
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+from marshmallow.schema import Schema
+from marshmallow.validate import Validator
+
+from django_marshmallow.fields import DJMFieldMixin, RelatedField, RelatedPKField
+
+
+def _is_default(field, method_name, base_class):
+    return getattr(type(field), method_name) is getattr(base_class, method_name)
+
+
+def _reads_attribute(field):
+    """
+    Return True if the field value is read with a plain attribute lookup.
+    """
+    return (
+        field._CHECK_ATTRIBUTE
+        and '.' not in (field.attribute or '')
+        and _is_default(field, 'serialize', ma.fields.Field)
+        and _is_default(field, 'get_value', ma.fields.Field)
+    )
+
+
+def get_compiled_nested_dumper(field, native_types=False):
+    """
+    Return the compiled dumper of a single nested schema, or `None`.
+    """
+    if not isinstance(field, ma.fields.Nested) or field.many:
+        return None
+    if not _is_default(field, '_serialize', ma.fields.Nested):
+        return None
+
+    schema = field.schema
+    if schema.many or not hasattr(schema, 'compiled_dumper'):
+        return None
+    if schema._has_processors(PRE_DUMP) or schema._has_processors(POST_DUMP):
+        return None
+    return schema.compiled_native_dumper if native_types else schema.compiled_dumper
+
+
+# ISO 8601 formatting functions of date and time fields, skipped for native type dumps
+_ISO_FORMAT_FUNCS = (utils.isoformat, utils.to_iso_date, utils.to_iso_time)
+
+
+def get_field_layout(field, native_types=False):
+    """
+    Return a hashable description of how the field is compiled. Fields with the same
+    layout share the generated source code. With `native_types`, date, time and UUID
+    values are dumped as Python objects instead of strings.
+    """
+    if isinstance(field, (RelatedPKField, RelatedField)) and field.read_from_attname:
+        if _is_default(field, 'serialize', ma.fields.Field):
+            return ('attname', isinstance(field, RelatedField))
+        return ('generic',)
+
+    if not _reads_attribute(field):
+        return ('generic',)
+
+    if _is_default(field, '_serialize', ma.fields.String):
+        if native_types and isinstance(field, ma.fields.UUID):
+            return ('native',)
+        return ('string',)
+
+    if _is_default(field, '_serialize', ma.fields.Number):
+        if _is_default(field, '_format_num', ma.fields.Decimal):
+            fast = field.places is None and not field.allow_nan
+            return ('decimal', fast, field.as_string)
+        if _is_default(field, '_format_num', ma.fields.Number) and _is_default(field, '_to_string', ma.fields.Number):
+            return ('number', field.as_string)
+
+    if _is_default(field, '_serialize', ma.fields.DateTime):
+        format_func = field.SERIALIZATION_FUNCS.get(field.format or field.DEFAULT_FORMAT)
+        if native_types and format_func in _ISO_FORMAT_FUNCS:
+            return ('native',)
+        if format_func is utils.isoformat:
+            return ('isoformat',)
+        return ('datetime', format_func is not None)
+
+    if get_compiled_nested_dumper(field, native_types) is not None:
+        return ('nested', native_types)
+
+    return ('direct',)
+
+
+def _get_value_expression(kind, i):
+    if kind[0] == 'string':
+        return 'value if value.__class__ is str else ensure_text_type(value)'
+    if kind[0] == 'number':
+        expr = f'value if value.__class__ is num_type_{i} else num_type_{i}(value)'
+        return f'str({expr})' if kind[1] else expr
+    if kind[0] == 'decimal':
+        fast, as_string = kind[1:]
+        expr = 'value if value.__class__ is Decimal else Decimal(str(value))' if fast else f'field_{i}._format_num(value)'
+        return f'format({expr}, "f")' if as_string else expr
+    if kind[0] == 'isoformat':
+        return 'value.isoformat()'
+    if kind[0] == 'native':
+        return 'value'
+    if kind[0] == 'datetime':
+        return f'format_func_{i}(value)' if kind[1] else f'value.strftime(format_{i})'
+    if kind[0] == 'nested':
+        return f'nested_dumper_{i}(value)'
+    raise ValueError(kind)
+
+
+def generate_dumper_source(layout):
+    """
+    Return the source code of a dumper factory for the given layout, which is a tuple of
+    `(attr_name, data_key, attribute, kind)` items.
+    """
+    args = ', '.join(f'field_{i}' for i in range(len(layout)))
+    lines = [f'def make_dumper(dict_class, generic_dump, get_attribute, {args}):']
+
+    for i, (attr_name, data_key, attribute, kind) in enumerate(layout):
+        if kind[0] == 'number':
+            lines.append(f'    num_type_{i} = field_{i}.num_type')
+        elif kind[0] == 'datetime':
+            lines.append(f'    format_{i} = field_{i}.format or field_{i}.DEFAULT_FORMAT')
+            lines.append(f'    format_func_{i} = field_{i}.SERIALIZATION_FUNCS.get(format_{i})')
+        elif kind[0] == 'nested':
+            lines.append(f'    nested_dumper_{i} = get_compiled_nested_dumper(field_{i}, {kind[1]!r})')
+        elif kind[0] == 'attname':
+            lines.append(f'    attname_{i} = field_{i}.related_pk_field.model_field.attname' if kind[1] else
+                         f'    attname_{i} = field_{i}.model_field.attname')
+            lines.append(f'    pk_serialize_{i} = field_{i}.related_pk_field.related_pk_value_field._serialize' if kind[1] else
+                         f'    pk_serialize_{i} = field_{i}.related_pk_value_field._serialize')
+            if kind[1]:
+                lines.append(f'    target_field_{i} = field_{i}.target_field')
+
+    lines.append('')
+    lines.append('    def dump(obj):')
+    lines.append('        if hasattr(obj, "__getitem__"):')
+    lines.append('            return generic_dump(obj)')
+    lines.append('        ret = dict_class()')
+
+    for i, (attr_name, data_key, attribute, kind) in enumerate(layout):
+        generic = [
+            f'value = field_{i}.serialize({attr_name!r}, obj, accessor=get_attribute)',
+            'if value is not missing:',
+            f'    ret[{data_key!r}] = value',
+        ]
+        if kind[0] == 'generic':
+            lines.extend(f'        {line}' for line in generic)
+            continue
+
+        if kind[0] == 'attname':
+            lines.append(f'        value = getattr(obj, attname_{i}, missing)')
+            expr = f'pk_serialize_{i}(value, {attr_name!r}, obj)'
+            if kind[1]:
+                expr = f'{{target_field_{i}: {expr}}}'
+        else:
+            lines.append(f'        value = getattr(obj, {attribute!r}, missing)')
+            if kind[0] == 'direct':
+                expr = f'field_{i}._serialize(value, {attr_name!r}, obj)'
+            else:
+                expr = f'None if value is None else {_get_value_expression(kind, i)}'
+
+        lines.append('        if value is missing:')
+        lines.extend(f'            {line}' for line in generic)
+        lines.append('        else:')
+        lines.append(f'            ret[{data_key!r}] = {expr}')
+
+    lines.append('        return ret')
+    lines.append('')
+    lines.append('    return dump')
+    return '\n'.join(lines)
+
+
+_namespace = {
+    'missing': ma.missing,
+    'ensure_text_type': utils.ensure_text_type,
+    'Decimal': decimal.Decimal,
+    'get_compiled_nested_dumper': get_compiled_nested_dumper,
+}
+
+
+_factories_lock = threading.Lock()
+
+
+def get_cached_factory(factories, layout, generate_source, namespace, filename, name):
+    """
+    Return the generated factory function of the field layout from the `factories` cache of
+    a schema class. The least recently used layouts are dropped beyond the
+    `COMPILED_SCHEMA_CACHE_SIZE` setting, so per-call field selections do not keep
+    generated code for the life of the process.
+    """
+    from django_marshmallow.settings import ma_settings
+
+    with _factories_lock:
+        factory = factories.get(layout)
+        if factory is not None:
+            factories.move_to_end(layout)
+            return factory
+
+    namespace = dict(namespace)
+    exec(compile(generate_source(layout), filename, 'exec'), namespace)
+    factory = namespace[name]
+
+    cache_size = ma_settings.COMPILED_SCHEMA_CACHE_SIZE
+    if cache_size:
+        with _factories_lock:
+            factory = factories.setdefault(layout, factory)
+            while len(factories) > cache_size:
+                factories.popitem(last=False)
+    return factory
+
+
+def compile_dumper(schema, native_types=False):
+    """
+    Return a function dumping a single object with the fields of the given schema
+    instance, or `None` when the schema cannot be compiled. The generated code is cached
+    per schema class and field layout.
+    """
+    if type(schema).get_attribute is not Schema.get_attribute:
+        return None
+
+    dump_fields = list(schema.dump_fields.items())
+    layout = tuple(
+        (
+            attr_name,
+            field.data_key if field.data_key is not None else attr_name,
+            field.attribute or attr_name,
+            get_field_layout(field, native_types)
+        )
+        for attr_name, field in dump_fields
+    )
+
+    make_dumper = get_cached_factory(
+        type(schema)._compiled_dumper_factories,
+        layout,
+        generate_dumper_source,
+        _namespace,
+        f'<{type(schema).__name__} dumper>',
+        'make_dumper'
+    )
+
+    def generic_dump(obj):
+        return Schema._serialize(schema, obj, many=False)
+
+    return make_dumper(
+        schema.dict_class,
+        generic_dump,
+        schema.get_attribute,
+        *(field for _, field in dump_fields)
+    )
+
+
+def get_load_field_layout(field):
+    """
+    Return a hashable description of how the field is compiled for loading.
+    """
+    if not (
+        _is_default(field, 'deserialize', ma.fields.Field)
+        and _is_default(field, '_validate_missing', ma.fields.Field)
+        and type(field)._validate in (ma.fields.Field._validate, DJMFieldMixin._validate)
+    ):
+        return ('generic',)
+
+    if _is_default(field, '_deserialize', ma.fields.String):
+        return ('string',)
+
+    if _is_default(field, '_deserialize', ma.fields.Number) and (
+        _is_default(field, '_validated', ma.fields.Number) or _is_default(field, '_validated', ma.fields.Integer)
+    ) and _is_default(field, '_format_num', ma.fields.Number):
+        return ('number',)
+
+    return ('direct',)
+
+
+def deserialize_field(field, raw_value, data_key, data, partial, error_store, index):
+    """
+    Deserialize a value through the regular field path and store its errors, like
+    `Schema._call_and_store` does.
+    """
+    try:
+        return field.deserialize(raw_value, data_key, data, partial=partial)
+    except ValidationError as error:
+        error_store.store_error(error.messages, data_key, index=index)
+        return error.valid_data or ma.missing
+
+
+def generate_loader_source(layout):
+    """
+    Return the source code of a loader factory for the given layout, which is a tuple of
+    `(data_key, attribute, kind)` items.
+    """
+    args = ', '.join(f'field_{i}' for i in range(len(layout)))
+    lines = [f'def make_loader(dict_class, data_keys, unknown_message, {args}):']
+
+    for i, (data_key, attribute, kind) in enumerate(layout):
+        lines.append(f'    allow_none_{i} = field_{i}.allow_none is True')
+        if kind[0] != 'generic':
+            lines.append(f'    validators_{i} = tuple(field_{i}.validators)')
+        if kind[0] == 'number':
+            lines.append(f'    num_type_{i} = field_{i}.num_type')
+
+    lines.append('')
+    lines.append('    def load(data, error_store, partial, unknown, index):')
+    lines.append('        ret = dict_class()')
+
+    for i, (data_key, attribute, kind) in enumerate(layout):
+        generic = f'deserialize_field(field_{i}, raw_value, {data_key!r}, data, partial, error_store, index)'
+        lines.append(f'        raw_value = data.get({data_key!r}, missing)')
+        lines.append('        if raw_value is missing:')
+        lines.append('            if partial is True:')
+        lines.append('                value = missing')
+        lines.append('            else:')
+        lines.append(f'                value = {generic}')
+        lines.append(f'        elif raw_value is None and allow_none_{i}:')
+        lines.append('            value = None')
+
+        if kind[0] == 'generic':
+            lines.append('        else:')
+            lines.append(f'            value = {generic}')
+        else:
+            lines.append('        else:')
+            lines.append('            try:')
+            if kind[0] == 'string':
+                lines.append('                if raw_value.__class__ is not str:')
+                lines.append('                    raise TypeError')
+                lines.append('                value = raw_value')
+            elif kind[0] == 'number':
+                lines.append(f'                if raw_value.__class__ is not num_type_{i}:')
+                lines.append('                    raise TypeError')
+                lines.append('                value = raw_value')
+            else:
+                lines.append(f'                value = field_{i}._deserialize(raw_value, {data_key!r}, data, partial=partial)')
+            lines.append(f'                for validator in validators_{i}:')
+            lines.append('                    if validator(value) is False and not isinstance(validator, Validator):')
+            lines.append('                        raise TypeError')
+            lines.append('            except Exception:')
+            lines.append(f'                value = {generic}')
+
+        lines.append('        if value is not missing:')
+        lines.append(f'            ret[{attribute!r}] = value')
+
+    lines.append('        if unknown != EXCLUDE:')
+    lines.append('            for key in set(data) - data_keys:')
+    lines.append('                if unknown == INCLUDE:')
+    lines.append('                    set_value(ret, key, data[key])')
+    lines.append('                elif unknown == RAISE:')
+    lines.append('                    error_store.store_error([unknown_message], key, index)')
+    lines.append('        return ret')
+    lines.append('')
+    lines.append('    return load')
+    return '\n'.join(lines)
+
+
+_loader_namespace = {
+    'missing': ma.missing,
+    'Validator': Validator,
+    'EXCLUDE': EXCLUDE,
+    'INCLUDE': INCLUDE,
+    'RAISE': RAISE,
+    'set_value': utils.set_value,
+    'deserialize_field': deserialize_field,
+}
+
+
+def compile_loader(schema):
+    """
+    Return a function loading a single mapping with the fields of the given schema
+    instance, or `None` when the schema cannot be compiled. The function takes
+    `(data, error_store, partial, unknown, index)` arguments, where `partial` must be a
+    boolean. The generated code is cached per schema class and field layout.
+    """
+    load_fields = list(schema.load_fields.items())
+    if any('.' in (field.attribute or attr_name) for attr_name, field in load_fields):
+        return None
+
+    layout = tuple(
+        (
+            field.data_key if field.data_key is not None else attr_name,
+            field.attribute or attr_name,
+            get_load_field_layout(field)
+        )
+        for attr_name, field in load_fields
+    )
+
+    make_loader = get_cached_factory(
+        type(schema)._compiled_loader_factories,
+        layout,
+        generate_loader_source,
+        _loader_namespace,
+        f'<{type(schema).__name__} loader>',
+        'make_loader'
+    )
+
+    return make_loader(
+        schema.dict_class,
+        frozenset(data_key for data_key, _, _ in layout),
+        schema.error_messages['unknown'],
+        *(field for _, field in load_fields)
+    )
@@ -0,0 +1,91 @@
+"""
+Per-call state of schema dump and load operations.
+
+Values which belong to a single `dump()` or `load()` call, like the current request or
+the related objects resolved for a payload, are kept in a `CallContext` bound to a
+context variable instead of on the schema or its fields. A schema instance can then be
+shared between threads and greenlets.
+"""
+import contextvars
+import weakref
+from contextlib import contextmanager
+from types import MappingProxyType
+
+
+_current_call_context = contextvars.ContextVar('django_marshmallow_call_context', default=None)
+_schema_states = contextvars.ContextVar('django_marshmallow_schema_states', default=None)
+
+
+class CallContext:
+    """
+    Holds the values of a schema dump or load call. Values which are not given fall back
+    to the enclosing call context, so nested schemas see the values of their root call.
+    """
+
+    def __init__(self, request=None, domain_for_file_urls=None, native_types=False, parent=None):
+        if parent is not None:
+            request = request if request is not None else parent.request
+            if domain_for_file_urls is None:
+                domain_for_file_urls = parent.domain_for_file_urls
+            native_types = native_types or parent.native_types
+        self.request = request
+        self.domain_for_file_urls = domain_for_file_urls
+        # dump date, time and UUID values as Python objects for encoders supporting them
+        self.native_types = native_types
+        # identity maps of `RelatedPKField.preload_related_objects` keyed by field id
+        self.related_objects = {}
+        # many-to-many primary keys of `RelatedPKField.collect_related_pks` keyed by field id
+        self.collected_pks = {}
+
+
+def get_call_context():
+    """
+    Return the `CallContext` of the running dump or load call, or `None` outside of it.
+    """
+    return _current_call_context.get()
+
+
+@contextmanager
+def call_context(request=None, domain_for_file_urls=None, native_types=False):
+    """
+    Run a dump or load call within a `CallContext`. Nested calls without values of their
+    own reuse the enclosing context.
+    """
+    parent = _current_call_context.get()
+    if parent is not None and request is None and domain_for_file_urls is None and not native_types:
+        yield parent
+        return
+
+    context = CallContext(
+        request=request,
+        domain_for_file_urls=domain_for_file_urls,
+        native_types=native_types,
+        parent=parent
+    )
+    token = _current_call_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_call_context.reset(token)
+
+
+def get_schema_state(schema):
+    """
+    Return a read-only mapping of the per-call attributes of a shared schema instance for
+    the current thread or task.
+    """
+    states = _schema_states.get()
+    state = states.get(schema) if states is not None else None
+    return MappingProxyType(state if state is not None else {})
+
+
+def set_schema_state(schema, **values):
+    """
+    Set per-call attributes of a shared schema instance for the current thread or task.
+    The states are copied on write, so tasks which inherited the context of their parent
+    do not overwrite the values of each other.
+    """
+    states = _schema_states.get()
+    new_states = weakref.WeakKeyDictionary(states) if states is not None else weakref.WeakKeyDictionary()
+    new_states[schema] = {**new_states.get(schema, {}), **values}
+    _schema_states.set(new_states)
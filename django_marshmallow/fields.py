@@ -1,15 +1,34 @@
+import copy
 import typing
-from collections import OrderedDict
 from urllib.parse import urljoin
 
-from django.core.exceptions import ObjectDoesNotExist
-from django.db import models
+from django import forms
+from django.db import connections, models
+from django.utils.functional import cached_property
 
 import marshmallow as ma
 from marshmallow import ValidationError, validate
 from django.core.exceptions import ValidationError as DjangoValidationError
 from marshmallow.validate import Validator
 
+from django_marshmallow.context import get_call_context
+from django_marshmallow.utils import get_default_ordering
+
+
+def copy_field(field):
+    """
+    Return a copy of a schema field for binding to a schema instance. Django model fields,
+    querysets and other metadata are shared with the declared field, only the mutable
+    containers of the field are cloned.
+    """
+    field_copy = copy.copy(field)
+    field_copy.validators = list(field.validators)
+    field_copy.error_messages = dict(field.error_messages)
+    field_copy.metadata = dict(field.metadata)
+    if isinstance(field.missing, list):
+        field_copy.missing = list(field.missing)
+    return field_copy
+
 
 class DJMFieldMixin:
     GENERIC_VALIDATORS = {
@@ -20,6 +39,9 @@ class DJMFieldMixin:
         self.model_field = kwargs.pop('model_field', None)
         super().__init__(**kwargs)
 
+    def __deepcopy__(self, memo):
+        return copy_field(self)
+
     def _validate(self, value):
         """Perform validation on ``value``. Raise a :exc:`ValidationError` if validation
         does not succeed.
@@ -80,8 +102,11 @@ class FileField(DJMFieldMixin, ma.fields.Field):
         if not value:
             return None
 
+        context = get_call_context()
         use_url = getattr(self, 'use_url', self.root.opts.use_file_url)
-        custom_domain = getattr(self, 'custom_domain', self.root.opts.domain_for_file_urls)
+        custom_domain = context and context.domain_for_file_urls
+        if not custom_domain:
+            custom_domain = getattr(self, 'custom_domain', self.root.opts.domain_for_file_urls)
         if use_url:
             try:
                 url = value.url
@@ -90,7 +115,7 @@ class FileField(DJMFieldMixin, ma.fields.Field):
             if custom_domain:
                 return urljoin(custom_domain, url)
 
-            request = self.metadata.get('request')
+            request = (context and context.request) or self.metadata.get('request')
             if request:
                 return request.build_absolute_uri(url)
 
@@ -100,13 +125,69 @@ class FileField(DJMFieldMixin, ma.fields.Field):
 
 class ImageField(FileField):
 
-    def _deserialize(self, value, attr, data, **kwargs):
-        image_file = super()._deserialize(value, attr, data, **kwargs)
+    default_error_messages = {
+        'invalid_image': 'Upload a valid image. The file you uploaded was either not an image or a corrupted image.',
+    }
+
+    def __init__(self, **kwargs):
+        if 'verify_image' in kwargs:
+            self.verify_image = kwargs.pop('verify_image')
+        super().__init__(**kwargs)
+
+    def __deepcopy__(self, memo):
+        field_copy = super().__deepcopy__(memo)
+        # the form field uses the error messages of the field it was built for
+        field_copy.__dict__.pop('formfield', None)
+        return field_copy
+
+    @cached_property
+    def formfield(self):
+        """
+        The Django form field validating uploaded images, built on the first load.
+        """
         field_kwargs = self.metadata.get('field_kwargs', {})
         django_form_field_kwargs = field_kwargs.get('_django_form_field_kwargs')
         django_form_field = self.model_field.formfield(**django_form_field_kwargs)
+        self.error_messages = {**django_form_field.error_messages, **self.error_messages}
         django_form_field.error_messages = self.error_messages
-        return django_form_field.clean(image_file)
+        return django_form_field
+
+    def _deserialize(self, value, attr, data, **kwargs):
+        image_file = super()._deserialize(value, attr, data, **kwargs)
+        verify_image = getattr(self, 'verify_image', self.root.opts.verify_images)
+        try:
+            if verify_image:
+                return self.formfield.clean(image_file)
+            return self._clean_image_header(image_file)
+        except DjangoValidationError as error:
+            raise ValidationError(error.messages[0])
+
+    def _clean_image_header(self, image_file):
+        """
+        Clean an uploaded image like the Django form field does, but check only the format
+        and dimensions read from the image header instead of decoding the whole image.
+        """
+        from PIL import Image
+
+        formfield = self.formfield
+        image_file = forms.FileField.to_python(formfield, image_file)
+        if hasattr(image_file, 'temporary_file_path'):
+            file = image_file.temporary_file_path()
+        else:
+            file = image_file
+        try:
+            with Image.open(file) as image:
+                image_file.image = image
+                image_file.content_type = Image.MIME.get(image.format)
+        except Exception as exc:
+            raise DjangoValidationError(formfield.error_messages['invalid_image'], code='invalid_image') from exc
+        finally:
+            if hasattr(image_file, 'seek') and callable(image_file.seek):
+                image_file.seek(0)
+
+        formfield.validate(image_file)
+        formfield.run_validators(image_file)
+        return image_file
 
 
 class String(DJMFieldMixin, ma.fields.String):
@@ -117,8 +198,49 @@ class String(DJMFieldMixin, ma.fields.String):
             self.validators.append(self.GENERIC_VALIDATORS.get('allow_blank'))
 
 
+class ChoiceValidator(validate.OneOf):
+    """
+    `OneOf` validator checking membership in a frozenset of the choices. The choices and
+    labels text of the error message is only built when a value fails validation.
+    """
+
+    def __init__(self, choices, labels=None, *, error=None):
+        self.choices = tuple(choices)
+        self.labels = tuple(labels) if labels is not None else ()
+        self.error = error or self.default_message
+        try:
+            self.choices_set = frozenset(self.choices)
+        except TypeError:
+            # unhashable choices are looked up in the choices tuple
+            self.choices_set = self.choices
+
+    @cached_property
+    def choices_text(self):
+        return ', '.join(str(choice) for choice in self.choices)
+
+    @cached_property
+    def labels_text(self):
+        return ', '.join(str(label) for label in self.labels)
+
+    def __call__(self, value):
+        try:
+            if value not in self.choices_set:
+                raise ValidationError(self._format_error(value))
+        except TypeError as error:
+            # unhashable values are never a choice
+            raise ValidationError(self._format_error(value)) from error
+        return value
+
+
+# `show_select_options` value which dumps the select options once per response envelope
+SELECT_OPTIONS_ENVELOPE = 'envelope'
+
+
 class ChoiceField(String):
 
+    # `show_select_options` schema option, read when the field is bound to a schema
+    show_select_options = False
+
     def __init__(self, choices, **kwargs):
         if not isinstance(choices, (list, tuple)):
             raise ValueError(f'{self.name} `choices` must be a list or tuple.')
@@ -126,17 +248,22 @@ class ChoiceField(String):
         self.choices = choices
         super().__init__(**kwargs)
         if self.choices:
-            choices_dict = OrderedDict(self.choices)
-            choices_validator = validate.OneOf(choices=choices_dict.keys(), labels=choices_dict.values())
+            choices_dict = dict(self.choices)
+            choices_validator = ChoiceValidator(choices=choices_dict.keys(), labels=choices_dict.values())
             self.validators.append(choices_validator)
-            self.select_options = choices_validator.options()
+            # computed once and shared by all dumped values and copies of the field
+            self.select_options = tuple(choices_validator.options())
+
+    def _bind_to_schema(self, field_name, schema):
+        super()._bind_to_schema(field_name, schema)
+        self.show_select_options = getattr(self.root.opts, 'show_select_options', False)
 
     def _serialize(self, value, attr, obj, **kwargs) -> typing.Optional[str]:
         serialized_data = super()._serialize(value, attr, obj, **kwargs)
-        if self.choices and self.root.opts.show_select_options:
+        if self.choices and self.show_select_options and self.show_select_options != SELECT_OPTIONS_ENVELOPE:
             return {
                 'value': serialized_data,
-                'options': list(self.select_options)
+                'options': self.select_options
             }
         return serialized_data
 
@@ -196,17 +323,162 @@ class RelatedPKField(ma.fields.Field):
         self.to_field = to_field
         self.many = many
         self.queryset = kwargs.get('queryset', related_model._default_manager)
+        # forward relations targeting the related primary key are dumped from the local column
+        target_field = getattr(model_field, 'target_field', None)
+        self.read_from_attname = bool(
+            not many and getattr(model_field, 'concrete', False) and target_field and target_field.primary_key
+        )
+
+    def __deepcopy__(self, memo):
+        return copy_field(self)
+
+    def get_value(self, obj, attr, accessor=None, default=ma.missing):
+        if self.read_from_attname and not isinstance(obj, dict):
+            return getattr(obj, self.model_field.attname, default)
+        return super().get_value(obj, attr, accessor=accessor, default=default)
 
     def _serialize(self, value: typing.Any, attr: str, obj: typing.Any, **kwargs):
+        if self.read_from_attname or isinstance(obj, dict):
+            # rows of `BaseModelSchema.dump_values` hold raw primary keys
+            return self.related_pk_value_field._serialize(value, attr, obj)
+
+        collected_pks = self.get_collected_pks() if self.many else None
+        if collected_pks is not None and obj.pk in collected_pks:
+            value = collected_pks[obj.pk]
+            return self.related_pk_value_field._serialize(value, attr, obj)
+
         related_field_value = getattr(obj, attr, None)
         if self.many and isinstance(related_field_value, models.Manager):
-            value = list(related_field_value.values_list('pk', flat=True))
+            queryset = related_field_value.get_queryset()
+            if queryset._result_cache is not None:
+                # populated by `prefetch_related`
+                value = [related_obj.pk for related_obj in queryset]
+            else:
+                queryset = queryset.order_by(*get_default_ordering(self.related_model))
+                value = list(queryset.values_list('pk', flat=True))
         if self.many and isinstance(related_field_value, list):
             value = [v.pk for v in related_field_value if isinstance(v, self.related_model)]
         if self.to_field:
             value = getattr(related_field_value, self.to_field)
         return self.related_pk_value_field._serialize(value, attr, obj)
 
+    def get_related_pks(self, value):
+        """
+        Return the deserialized primary keys of a raw field value, invalid values are skipped.
+        """
+        if value is None:
+            return []
+        try:
+            value = self.related_pk_value_field.deserialize(value)
+        except ValidationError:
+            return []
+        return list(value) if self.many else [value]
+
+    def get_related_objects(self, pks):
+        """
+        Return a dict of related model objects keyed by primary key, fetched with a single query.
+        Keys preloaded by `preload_related_objects` are served from the identity map.
+        """
+        context = get_call_context()
+        identity_map = context and context.related_objects.get(id(self))
+        if identity_map is None:
+            return self.queryset.in_bulk(set(pks))
+
+        missing_pks = {pk for pk in pks if pk not in identity_map}
+        if missing_pks:
+            identity_map.update(dict.fromkeys(missing_pks))
+            identity_map.update(self.queryset.in_bulk(missing_pks))
+        return identity_map
+
+    def preload_related_objects(self, pks):
+        """
+        Resolve the given primary keys with a single query and keep them in an identity map
+        of the current call context until `clear_related_objects` is called.
+        """
+        context = get_call_context()
+        if context is None:
+            return
+        pks = set(pks)
+        identity_map = context.related_objects[id(self)] = dict.fromkeys(pks)
+        if pks:
+            identity_map.update(self.queryset.in_bulk(pks))
+
+    async def apreload_related_objects(self, pks):
+        """
+        Asynchronous `preload_related_objects`, using the asynchronous ORM of Django 4.1+.
+        """
+        context = get_call_context()
+        if context is None:
+            return
+        pks = set(pks)
+        identity_map = dict.fromkeys(pks)
+        if pks:
+            identity_map.update(await self.queryset.ain_bulk(pks))
+        context.related_objects[id(self)] = identity_map
+
+    def has_related_objects(self):
+        context = get_call_context()
+        return context is not None and id(self) in context.related_objects
+
+    def clear_related_objects(self):
+        context = get_call_context()
+        if context is not None:
+            context.related_objects.pop(id(self), None)
+
+    def get_m2m_pks(self, source_pks):
+        """
+        Return a dict of many-to-many related primary keys keyed by the given source model
+        primary keys, loaded with a single query on the through table.
+        """
+        through = self.model_field.remote_field.through
+        source_attname = through._meta.get_field(self.model_field.m2m_field_name()).attname
+        target_name = self.model_field.m2m_reverse_field_name()
+        target_attname = through._meta.get_field(target_name).attname
+        source_pks = list(set(source_pks))
+        m2m_pks = {pk: [] for pk in source_pks}
+
+        # the keys are ordered like the related objects of a regular dump
+        ordering = []
+        for order in get_default_ordering(self.related_model):
+            if not isinstance(order, str):
+                # expressions cannot be joined through the target field
+                ordering = [f'{target_name}__pk']
+                break
+            descending = order.startswith('-')
+            ordering.append(f'{"-" if descending else ""}{target_name}__{order.lstrip("-")}')
+
+        batch_size = connections[through._default_manager.db].features.max_query_params or len(source_pks)
+        for i in range(0, len(source_pks), batch_size):
+            pairs = through._default_manager.filter(
+                **{f'{source_attname}__in': source_pks[i:i + batch_size]}
+            ).order_by(*ordering).values_list(source_attname, target_attname)
+            for source_pk, target_pk in pairs:
+                m2m_pks[source_pk].append(target_pk)
+        return m2m_pks
+
+    def collect_related_pks(self, objs):
+        """
+        Load the many-to-many primary keys of all given model objects without prefetched
+        relations with a single query on the through table. The collected keys are used for dumping within the current
+        call context until `clear_collected_pks` is called.
+        """
+        context = get_call_context()
+        if context is None:
+            return
+        # relations prefetched into the objects are dumped from the prefetch cache
+        objs = [obj for obj in objs if self.model_field.name not in getattr(obj, '_prefetched_objects_cache', ())]
+        if objs:
+            context.collected_pks[id(self)] = self.get_m2m_pks(obj.pk for obj in objs)
+
+    def get_collected_pks(self):
+        context = get_call_context()
+        return context and context.collected_pks.get(id(self))
+
+    def clear_collected_pks(self):
+        context = get_call_context()
+        if context is not None:
+            context.collected_pks.pop(id(self), None)
+
     def _validate(self, value):
         if self.many and not isinstance(value, (list, tuple)):
             raise ValidationError('ManytoMany fields values must be `list` or `tuple`')
@@ -218,13 +490,8 @@ class RelatedPKField(ma.fields.Field):
         value = self.related_pk_value_field.deserialize(value, attr, data)
 
         if self.many and isinstance(value, (list, tuple)):
-            invalid_pks = []
-            data = []
-            for pk in value:
-                try:
-                    data.append(self.queryset.get(pk=pk))
-                except ObjectDoesNotExist:
-                    invalid_pks.append(pk)
+            related_objects = self.get_related_objects(value)
+            invalid_pks = [pk for pk in value if related_objects.get(pk) is None]
 
             if invalid_pks:
                 raise self.make_error(
@@ -233,18 +500,18 @@ class RelatedPKField(ma.fields.Field):
                     value=', '.join('{0}'.format(n) for n in invalid_pks),
                     related_model=self.related_model.__name__
                 )
-            return data
+            return [related_objects[pk] for pk in value]
 
         if self.to_field:
-            try:
-                return self.queryset.get(pk=value)
-            except ObjectDoesNotExist:
+            related_object = self.get_related_objects([value]).get(value)
+            if related_object is None:
                 raise self.make_error(
                     'related_object_does_not_exists',
                     field_name=self.model_field.name,
                     value=str(value),
                     related_model=self.related_model.__name__
                 )
+            return related_object
         raise self.make_error('invalid_value')
 
 
@@ -276,6 +543,39 @@ class RelatedField(ma.fields.Field):
                 ' `related_model` parameter.'
             )
 
+    def __deepcopy__(self, memo):
+        field_copy = copy_field(self)
+        if isinstance(self.related_pk_field, ma.fields.Field):
+            field_copy.related_pk_field = copy.deepcopy(self.related_pk_field, memo)
+        return field_copy
+
+    @property
+    def read_from_attname(self):
+        return getattr(self.related_pk_field, 'read_from_attname', False)
+
+    def get_value(self, obj, attr, accessor=None, default=ma.missing):
+        if self.read_from_attname:
+            return self.related_pk_field.get_value(obj, attr, accessor=accessor, default=default)
+        return super().get_value(obj, attr, accessor=accessor, default=default)
+
+    def get_related_pks(self, value):
+        """
+        Return the deserialized primary keys of a raw field value, invalid values are skipped.
+        """
+        items = value if self.many and isinstance(value, list) else [value]
+        related_pk_values = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            data_key = self.target_field if self.target_field in item else 'pk'
+            related_pk_values.append(item.get(data_key))
+
+        if not isinstance(self.related_pk_field, RelatedPKField):
+            return []
+        if self.many:
+            return self.related_pk_field.get_related_pks(related_pk_values)
+        return self.related_pk_field.get_related_pks(related_pk_values[0] if related_pk_values else None)
+
     def _serialize(self, value: typing.Any, attr: str, obj: typing.Any, **kwargs):
         if self.many:
             return [{self.target_field: m} for m in self.related_pk_field.serialize(attr, obj)]
@@ -350,6 +650,19 @@ class RelatedNested(ma.fields.Nested):
                 ' `related_model` parameter.'
             )
 
+    def __deepcopy__(self, memo):
+        field_copy = copy_field(self)
+        # the nested schema instance is bound to the parent schema of the copy
+        field_copy._schema = None
+        return field_copy
+
+    @property
+    def schema(self):
+        schema = super().schema
+        if getattr(self.parent, 'shared', False) and hasattr(schema, 'shared'):
+            schema.shared = True
+        return schema
+
     def _deserialize(self, value, attr=None, data=None, **kwargs):
         data = super()._deserialize(value, attr, data, **kwargs)
         if data:
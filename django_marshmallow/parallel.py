@@ -0,0 +1,137 @@
+"""
+Parallel dumps of large querysets.
+
+The queryset is split into primary key ranges which are dumped by worker processes.
+Workers import the schema class by its dotted path and open their own database
+connections.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+import django
+from django.apps import apps
+from django.db import connections
+from django.utils.module_loading import import_string
+
+
+def get_schema_path(schema_class):
+    """
+    Return the dotted import path of a schema class, which must be defined at module level.
+    """
+    path = f'{schema_class.__module__}.{schema_class.__qualname__}'
+    if '<locals>' in path:
+        raise ValueError(
+            f'{schema_class.__name__} schema class must be defined at module level to be dumped by worker processes.'
+        )
+    return path
+
+
+def get_pk_ranges(queryset, chunk_size):
+    """
+    Return a list of `(start, end)` primary key ranges holding at most `chunk_size` rows of
+    the queryset each. `end` is exclusive and `None` for the last range.
+    """
+    boundaries = []
+    pks = queryset.order_by('pk').values_list('pk', flat=True)
+    for i, pk in enumerate(pks.iterator(chunk_size=chunk_size)):
+        if i % chunk_size == 0:
+            boundaries.append(pk)
+    return list(zip(boundaries, boundaries[1:] + [None]))
+
+
+def init_worker():
+    """
+    Prepare a worker process: set up Django when the process was spawned and drop the
+    database connections inherited from the parent process.
+    """
+    if not apps.ready:
+        django.setup()
+    connections.close_all()
+
+
+def dump_pk_range(schema, schema_kwargs, model_label, query, start, end, ndjson):
+    """
+    Dump the rows of a primary key range and return the encoded JSON array items, or
+    newline delimited JSON, as `bytes`.
+    """
+    if isinstance(schema, str):
+        schema = import_string(schema)
+    model = apps.get_model(model_label)
+    queryset = model._default_manager.all()
+    queryset.query = query
+
+    queryset = queryset.filter(pk__gte=start)
+    if end is not None:
+        queryset = queryset.filter(pk__lt=end)
+    queryset = queryset.order_by('pk')
+
+    encoded = schema(**schema_kwargs).dumps_bytes(queryset, many=True, ndjson=ndjson)
+    return encoded if ndjson else encoded.strip()[1:-1]
+
+
+def parallel_dump(
+        schema,
+        queryset,
+        *,
+        chunk_size=10000,
+        workers=None,
+        ordered=True,
+        ndjson=False,
+        executor=None,
+        close_connections=True
+):
+    """
+    Dump a queryset with the given schema instance in worker processes and yield encoded
+    `bytes` chunks of a JSON array, or of newline delimited JSON. Each worker dumps a
+    primary key range of `chunk_size` rows, ordered by primary key. With `ordered`, the
+    ranges are yielded in primary key order, otherwise as soon as they are done.
+
+    A `concurrent.futures` executor can be given instead of the default process pool of
+    `workers` processes. The schema class is passed to thread pool executors as is and to
+    other executors by its import path.
+
+    Database connections must not be shared with forked worker processes. Unless
+    `close_connections` is disabled, the database connections of the calling thread are
+    therefore closed before the default process pool is started, and Django reopens them
+    on their next use. Connections in an atomic block are never closed. Disable it only
+    when the calling thread holds no open connection or the processes are not forked.
+    """
+    schema_class = type(schema)
+    schema_ref = schema_class if isinstance(executor, ThreadPoolExecutor) else get_schema_path(schema_class)
+    schema_kwargs = {
+        'only': tuple(schema.only) if schema.only is not None else None,
+        'exclude': tuple(set(schema.exclude) - set(schema.opts.exclude)),
+    }
+    model = queryset.model
+    query = queryset.query
+    pk_ranges = get_pk_ranges(queryset, chunk_size)
+
+    own_executor = executor is None
+    if own_executor:
+        # connections must not be shared with forked worker processes
+        if close_connections and not any(conn.in_atomic_block for conn in connections.all()):
+            connections.close_all()
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+
+    futures = []
+    try:
+        futures = [
+            executor.submit(dump_pk_range, schema_ref, schema_kwargs, model._meta.label, query, start, end, ndjson)
+            for start, end in pk_ranges
+        ]
+        results = (future.result() for future in (futures if ordered else as_completed(futures)))
+
+        if not ndjson:
+            yield b'['
+        separator = b''
+        for chunk in results:
+            if not chunk:
+                continue
+            yield chunk if ndjson else separator + chunk
+            separator = b','
+        if not ndjson:
+            yield b']'
+    finally:
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
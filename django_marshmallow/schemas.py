@@ -1,23 +1,51 @@
 import copy
+import json
+import threading
 import typing
 from collections import OrderedDict
+from collections.abc import Mapping
+from decimal import Decimal
 from itertools import chain
 
-from django.core.exceptions import ImproperlyConfigured
-from django.db import models
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured, SynchronousOnlyOperation
+from django.db import connections, models, transaction
+from django.db.models import Prefetch, prefetch_related_objects
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import ModelIterable
+from django.test.signals import setting_changed
 from django.utils.functional import cached_property
-from marshmallow.fields import Field
+from marshmallow.decorators import POST_DUMP, PRE_DUMP
+from marshmallow.fields import Constant, Field, Nested
 from marshmallow.schema import SchemaMeta, SchemaOpts
 
-from marshmallow import Schema, ValidationError
+from marshmallow import RAISE, Schema, ValidationError
+from marshmallow.utils import is_collection
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from django_marshmallow.compiler import compile_dumper, compile_loader
+from django_marshmallow.context import call_context, get_call_context, get_schema_state, set_schema_state
 from django_marshmallow.converter import ModelFieldConverter
-from django_marshmallow.fields import RelatedField, RelatedNested
-from django_marshmallow.utils import construct_instance
+from django_marshmallow.fields import ChoiceField, RelatedField, RelatedNested, RelatedPKField
+from django_marshmallow.parallel import parallel_dump
+from django_marshmallow.utils import (
+    construct_instance,
+    get_default_ordering,
+    iter_json_array,
+    iter_ndjson,
+    update_instance
+)
 
 
 ALL_FIELDS = '__all__'
 
+# the asynchronous queryset API was added in Django 4.1
+ASYNC_ORM = hasattr(models.QuerySet, 'ain_bulk')
+
 
 class ModelSchemaOpts(SchemaOpts):
 
@@ -75,6 +103,11 @@ class ModelSchemaOpts(SchemaOpts):
         self.show_select_options = getattr(meta, 'show_select_options', ma_settings.SHOW_SELECT_OPTIONS)
         self.use_file_url = getattr(meta, 'use_file_url', ma_settings.USE_FILE_URL)
         self.domain_for_file_urls = getattr(meta, 'domain_for_file_urls', ma_settings.DOMAIN_FOR_FILE_URLS)
+        self.verify_images = getattr(meta, 'verify_images', ma_settings.VERIFY_IMAGES)
+        self.optimize_queries = getattr(meta, 'optimize_queries', ma_settings.OPTIMIZE_QUERIES)
+        self.collect_m2m_pks = getattr(meta, 'collect_m2m_pks', ma_settings.COLLECT_M2M_PKS)
+        self.compile_dump = getattr(meta, 'compile_dump', ma_settings.COMPILE_DUMP)
+        self.compile_load = getattr(meta, 'compile_load', ma_settings.COMPILE_LOAD)
 
 
 class ModelSchemaMetaclass(SchemaMeta):
@@ -86,6 +119,17 @@ class ModelSchemaMetaclass(SchemaMeta):
             model_pk_field_name = klass.opts.model._meta.pk.name
             _pk_field = klass._declared_fields.get(model_pk_field_name)
         klass._pk_field = _pk_field
+        klass._related_field_names = tuple(
+            field_name for field_name, field in klass._declared_fields.items()
+            if isinstance(field, (RelatedField, RelatedNested))
+        )
+        klass._related_nested_names = tuple(
+            field_name for field_name, field in klass._declared_fields.items()
+            if isinstance(field, RelatedNested)
+        )
+        # generated dumper factories of `compiler.compile_dumper` keyed by field layout
+        klass._compiled_dumper_factories = OrderedDict()
+        klass._compiled_loader_factories = OrderedDict()
         return klass
 
     @classmethod
@@ -160,6 +204,55 @@ class ModelSchemaMetaclass(SchemaMeta):
 class BaseModelSchema(Schema, metaclass=ModelSchemaMetaclass):
     OPTIONS_CLASS = ModelSchemaOpts
 
+    def __init__(self, *, shared=False, **kwargs):
+        """
+        A `shared` schema instance keeps the results of its load calls per thread or task,
+        so a single instance can serve concurrent requests. Request specific values are
+        passed to each `dump()` and `load()` call.
+        """
+        super().__init__(**kwargs)
+        self.shared = shared
+        self._scoped_schemas = OrderedDict()
+        self._scoped_schemas_lock = threading.Lock()
+
+    def get_scoped_schema(self, only=None, exclude=()):
+        """
+        Return an instance of this schema limited to the given `only` and `exclude` field
+        names. Instances are cached per field selection, so a shared schema serves per-call
+        field selections without instantiating a schema on every call. The least recently
+        used instances are dropped beyond the `SCOPED_SCHEMA_CACHE_SIZE` setting.
+        """
+        from django_marshmallow.settings import ma_settings
+
+        if only is not None and self.only is not None:
+            only = [field_name for field_name in only if field_name.split('.', 1)[0] in self.only]
+        key = (None if only is None else frozenset(only), frozenset(exclude))
+        with self._scoped_schemas_lock:
+            schema = self._scoped_schemas.get(key)
+            if schema is not None:
+                self._scoped_schemas.move_to_end(key)
+                return schema
+
+        schema = type(self)(
+            only=only,
+            exclude=set(self.exclude) | set(exclude),
+            many=self.many,
+            context=self.context,
+            load_only=self.load_only,
+            dump_only=self.dump_only,
+            partial=self.partial,
+            unknown=self.unknown,
+            shared=self.shared
+        )
+
+        cache_size = ma_settings.SCOPED_SCHEMA_CACHE_SIZE
+        if cache_size:
+            with self._scoped_schemas_lock:
+                schema = self._scoped_schemas.setdefault(key, schema)
+                while len(self._scoped_schemas) > cache_size:
+                    self._scoped_schemas.popitem(last=False)
+        return schema
+
     @cached_property
     def model_class(self):
         return self.opts.model
@@ -177,50 +270,712 @@ class BaseModelSchema(Schema, metaclass=ModelSchemaMetaclass):
 
     @cached_property
     def related_fields(self):
-        related_fields = []
-        for field_name, field in self.fields.items():
-            if isinstance(field, (RelatedField, RelatedNested)):
-                related_fields.append((field_name, field))
-        return OrderedDict(related_fields)
+        return OrderedDict(
+            (field_name, self.fields[field_name])
+            for field_name in self._related_field_names if field_name in self.fields
+        )
 
     @cached_property
     def related_nesteds(self):
-        related_fields = []
-        for field_name, field in self.fields.items():
-            if isinstance(field, RelatedNested):
-                related_fields.append((field_name, field))
-        return OrderedDict(related_fields)
-
-    def _serialize(self, obj, many=False, *args, **kwargs):
-        if many and isinstance(obj, models.Manager):
-            obj = obj.get_queryset()
+        return OrderedDict(
+            (field_name, self.fields[field_name])
+            for field_name in self._related_nested_names if field_name in self.fields
+        )
+
+    def _get_relation_model_field(self, field_name, field):
+        attribute = field.attribute or field_name
+        try:
+            model_field = self.opts.model._meta.get_field(attribute)
+        except FieldDoesNotExist:
+            return None
+        return model_field if model_field.is_relation else None
+
+    def get_query_plan(self):
+        """
+        Return a `(select_related, prefetch_related)` tuple of lookups which are needed
+        to dump the schema fields without issuing a query per object.
+        """
+        select_related = []
+        prefetch_related = []
+        for field_name, field in self.dump_fields.items():
+            if not isinstance(field, (RelatedPKField, RelatedField, RelatedNested)):
+                continue
+
+            model_field = self._get_relation_model_field(field_name, field)
+            if model_field is None:
+                continue
+
+            lookup = model_field.name
+            to_many = model_field.many_to_many or model_field.one_to_many
+            nested_schema = field.schema if isinstance(field, RelatedNested) else None
+
+            if not isinstance(nested_schema, BaseModelSchema):
+                if to_many:
+                    if not (self.opts.collect_m2m_pks and self._get_m2m_pk_field(field)):
+                        related_model = model_field.related_model
+                        queryset = related_model._default_manager.order_by(*get_default_ordering(related_model))
+                        prefetch_related.append(Prefetch(lookup, queryset=queryset))
+                elif not getattr(field, 'read_from_attname', False):
+                    select_related.append(lookup)
+                continue
+
+            if to_many:
+                queryset = nested_schema.prepare_queryset(model_field.related_model._default_manager)
+                if model_field.one_to_many:
+                    # prefetched reverse foreign keys are matched through their local column
+                    queryset = queryset.defer(None)
+                prefetch_related.append(Prefetch(lookup, queryset=queryset))
+                continue
+
+            nested_select_related, nested_prefetch_related = nested_schema.get_query_plan()
+            select_related.append(lookup)
+            select_related.extend(f'{lookup}__{nested_lookup}' for nested_lookup in nested_select_related)
+            for nested_lookup in nested_prefetch_related:
+                if isinstance(nested_lookup, Prefetch):
+                    nested_lookup = Prefetch(
+                        f'{lookup}__{nested_lookup.prefetch_through}',
+                        queryset=nested_lookup.queryset
+                    )
+                else:
+                    nested_lookup = f'{lookup}__{nested_lookup}'
+                prefetch_related.append(nested_lookup)
+        return select_related, prefetch_related
+
+    def get_only_fields(self):
+        """
+        Return the minimal list of model field lookups for `QuerySet.only()` needed to dump
+        the schema fields, or `None` when the schema reads attributes that are not model
+        columns.
+        """
+        if self._has_processors(PRE_DUMP) or self._has_processors(POST_DUMP):
+            return None
+
+        only_fields = []
+        for field_name, field in self.dump_fields.items():
+            if isinstance(field, Constant):
+                continue
+
+            attribute = field.attribute or field_name
+            try:
+                model_field = self.opts.model._meta.get_field(attribute)
+            except FieldDoesNotExist:
+                return None
+
+            if not model_field.concrete:
+                if model_field.is_relation and (model_field.many_to_many or model_field.one_to_many):
+                    continue
+                return None
+
+            if model_field.many_to_many:
+                continue
+
+            only_fields.append(model_field.name)
+            if model_field.is_relation and isinstance(field, RelatedNested):
+                nested_schema = field.schema
+                if not isinstance(nested_schema, BaseModelSchema):
+                    return None
+                nested_only_fields = nested_schema.get_only_fields()
+                if nested_only_fields is None:
+                    return None
+                nested_only_fields = nested_only_fields or [model_field.related_model._meta.pk.name]
+                only_fields.extend(f'{model_field.name}__{f}' for f in nested_only_fields)
+        return only_fields
+
+    def optimize_queryset(self, queryset):
+        """
+        Apply the schema query plan and column projection to the given queryset.
+        Combined querysets are returned untouched, and the lookups and deferred fields
+        of the given queryset are kept.
+        """
+        if queryset.query.combinator:
+            return queryset
+
+        select_related, prefetch_related = self.get_query_plan()
+        select_related = [
+            lookup for lookup in select_related
+            if not self._is_deferred_lookup(queryset, lookup)
+        ]
+        if select_related:
+            queryset = queryset.select_related(*select_related)
+
+        # a lookup can only be prefetched once, so the lookups of the caller win
+        prefetched_paths = set()
+        for lookup in queryset._prefetch_related_lookups:
+            parts = (lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup).split(LOOKUP_SEP)
+            prefetched_paths.update(LOOKUP_SEP.join(parts[:i]) for i in range(1, len(parts) + 1))
+        prefetch_related = [
+            lookup for lookup in prefetch_related
+            if (lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup) not in prefetched_paths
+        ]
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related)
+
+        # keep the deferred fields of the given queryset
+        if queryset.query.deferred_loading == (frozenset(), True):
+            only_fields = self.get_only_fields()
+            if only_fields:
+                queryset = queryset.only(*only_fields)
+        return queryset
+
+    @staticmethod
+    def _is_deferred_lookup(queryset, lookup):
+        """
+        Return True if a relation along the `select_related` lookup is deferred on the queryset.
+        """
+        field_names, defer = queryset.query.deferred_loading
+        parts = lookup.split(LOOKUP_SEP)
+        for i in range(1, len(parts) + 1):
+            path = LOOKUP_SEP.join(parts[:i])
+            if defer:
+                if path in field_names:
+                    return True
+            elif path not in field_names and not any(
+                    name.startswith(path + LOOKUP_SEP) for name in field_names
+            ):
+                return True
+        return False
+
+    def prepare_queryset(self, queryset):
+        """
+        Return the queryset which will be iterated for dumping a manager or queryset.
+        """
+        if isinstance(queryset, models.Manager):
+            queryset = queryset.get_queryset()
+            if queryset._result_cache is not None:
+                # already evaluated by `prefetch_related`
+                return queryset
             if self.opts.order_by:
-                obj = obj.order_by(*self.opts.order_by)
-        return super()._serialize(obj, many=many)
+                queryset = queryset.order_by(*self.opts.order_by)
+
+        # `values()` and `values_list()` querysets cannot be shaped with `only()` or relations
+        if (
+                queryset._result_cache is None and self.opts.optimize_queries
+                and queryset._iterable_class is ModelIterable
+        ):
+            queryset = self.optimize_queryset(queryset)
+        return queryset
+
+    @staticmethod
+    def _get_m2m_pk_field(field):
+        """
+        Return the `RelatedPKField` which dumps primary keys of a forward many-to-many field.
+        """
+        related_pk_field = field.related_pk_field if isinstance(field, RelatedField) else field
+        if not isinstance(related_pk_field, RelatedPKField) or not related_pk_field.many:
+            return None
+        if not isinstance(related_pk_field.model_field, models.ManyToManyField):
+            return None
+        return related_pk_field
+
+    def _collect_m2m_pks(self, objs):
+        """
+        Load many-to-many primary keys of all objects with one through table query per field.
+        Returns the fields holding the collected primary keys.
+        """
+        objs = [o for o in objs if isinstance(o, self.opts.model)]
+        if not objs:
+            return []
+
+        related_pk_fields = []
+        for field in self.dump_fields.values():
+            related_pk_field = self._get_m2m_pk_field(field)
+            if related_pk_field is None:
+                continue
+            related_pk_field.collect_related_pks(objs)
+            related_pk_fields.append(related_pk_field)
+        return related_pk_fields
+
+    def dump(self, obj, *, many=None, only=None, exclude=(), request=None, domain_for_file_urls=None):
+        """
+        Serialize an object or a collection of objects. `only` and `exclude` limit the dumped
+        fields for this call, `request` and `domain_for_file_urls` are used to build file
+        field urls.
+        """
+        if only is not None or exclude:
+            return self.get_scoped_schema(only, exclude).dump(
+                obj,
+                many=many,
+                request=request,
+                domain_for_file_urls=domain_for_file_urls
+            )
+
+        many = self.many if many is None else bool(many)
+        if many and isinstance(obj, (models.Manager, models.QuerySet)):
+            obj = self.prepare_queryset(obj)
+
+        with call_context(request=request, domain_for_file_urls=domain_for_file_urls):
+            related_pk_fields = []
+            if many and self.opts.collect_m2m_pks and obj is not None:
+                obj = list(obj)
+                related_pk_fields = self._collect_m2m_pks(obj)
+            try:
+                return super().dump(obj, many=many)
+            finally:
+                for related_pk_field in related_pk_fields:
+                    related_pk_field.clear_collected_pks()
+
+    def dump_stream(self, queryset, chunk_size=2000, *, request=None, domain_for_file_urls=None, **kwargs):
+        """
+        Dump a manager or queryset as a JSON array, yielding encoded `bytes` chunks which can
+        be passed to a `StreamingHttpResponse`. Rows are fetched with `QuerySet.iterator()`
+        and prefetched related objects are loaded per chunk of `chunk_size` objects, so the
+        memory use does not grow with the number of rows. Additional keyword arguments are
+        passed to the `dumps` function of the schema `render_module`.
+        """
+        queryset = self.prepare_queryset(queryset)
+        prefetch_lookups = queryset._prefetch_related_lookups
+        if prefetch_lookups:
+            queryset = queryset.prefetch_related(None)
+
+        yield b'['
+        separator = b''
+        chunk = []
+        for obj in queryset.iterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= chunk_size:
+                yield separator + self._encode_stream_chunk(
+                    chunk, prefetch_lookups, request, domain_for_file_urls, kwargs
+                )
+                separator = b','
+                chunk = []
+        if chunk:
+            yield separator + self._encode_stream_chunk(chunk, prefetch_lookups, request, domain_for_file_urls, kwargs)
+        yield b']'
+
+    def _encode_stream_chunk(self, objs, prefetch_lookups, request, domain_for_file_urls, dumps_kwargs):
+        if prefetch_lookups:
+            prefetch_related_objects(objs, *prefetch_lookups)
+        data = self.dump(objs, many=True, request=request, domain_for_file_urls=domain_for_file_urls)
+        encoded = self.opts.render_module.dumps(data, **dumps_kwargs)
+        if isinstance(encoded, str):
+            encoded = encoded.encode()
+        # strip the array brackets, items of all chunks are joined into a single array
+        return encoded.strip()[1:-1]
+
+    def get_select_options(self):
+        """
+        Return the select options of the dumped choice fields keyed by their data key. The
+        choice fields of nested schemas are keyed by their dotted data key path.
+        """
+        select_options = {}
+        for field_name, field in self.dump_fields.items():
+            data_key = field.data_key if field.data_key is not None else field_name
+            if isinstance(field, ChoiceField) and field.choices:
+                select_options[data_key] = field.select_options
+            elif isinstance(field, Nested) and isinstance(field.schema, BaseModelSchema):
+                for path, options in field.schema.get_select_options().items():
+                    select_options[f'{data_key}.{path}'] = options
+        return select_options
+
+    def dump_envelope(self, obj, *, many=None, only=None, exclude=(), **kwargs):
+        """
+        Dump an object or a collection of objects into a `{'data': ..., 'select_options': ...}`
+        envelope which holds the select options of the choice fields once per response. Used
+        with the `show_select_options = 'envelope'` option, the dumped values do not repeat
+        the options.
+        """
+        schema = self.get_scoped_schema(only, exclude) if only is not None or exclude else self
+        return {
+            'data': schema.dump(obj, many=many, **kwargs),
+            'select_options': schema.get_select_options()
+        }
+
+    async def adump_stream(self, queryset, chunk_size=2000, *, request=None, domain_for_file_urls=None, **kwargs):
+        """
+        Asynchronous `dump_stream`, an async generator of encoded `bytes` chunks which can be
+        passed to a `StreamingHttpResponse` under ASGI. With the asynchronous ORM of Django
+        4.1+, rows are fetched with `QuerySet.aiterator()` and chunks are encoded on the event
+        loop. Otherwise every chunk of `dump_stream` is produced with `sync_to_async`.
+        """
+        if not ASYNC_ORM:
+            iterator = self.dump_stream(
+                queryset,
+                chunk_size,
+                request=request,
+                domain_for_file_urls=domain_for_file_urls,
+                **kwargs
+            )
+            next_chunk = sync_to_async(next)
+            try:
+                while True:
+                    chunk = await next_chunk(iterator, None)
+                    if chunk is None:
+                        break
+                    yield chunk
+            finally:
+                await sync_to_async(iterator.close)()
+            return
+
+        queryset = self.prepare_queryset(queryset)
+        prefetch_lookups = queryset._prefetch_related_lookups
+        if prefetch_lookups:
+            queryset = queryset.prefetch_related(None)
+
+        yield b'['
+        separator = b''
+        chunk = []
+        async for obj in queryset.aiterator(chunk_size=chunk_size):
+            chunk.append(obj)
+            if len(chunk) >= chunk_size:
+                yield separator + await self._aencode_stream_chunk(
+                    chunk, prefetch_lookups, request, domain_for_file_urls, kwargs
+                )
+                separator = b','
+                chunk = []
+        if chunk:
+            yield separator + await self._aencode_stream_chunk(
+                chunk, prefetch_lookups, request, domain_for_file_urls, kwargs
+            )
+        yield b']'
+
+    async def _aencode_stream_chunk(self, objs, prefetch_lookups, request, domain_for_file_urls, dumps_kwargs):
+        if prefetch_lookups:
+            await sync_to_async(prefetch_related_objects)(objs, *prefetch_lookups)
+        try:
+            return self._encode_stream_chunk(objs, (), request, domain_for_file_urls, dumps_kwargs)
+        except SynchronousOnlyOperation:
+            # a field or hook accessed a relation which was not prefetched
+            return await sync_to_async(self._encode_stream_chunk)(
+                objs, (), request, domain_for_file_urls, dumps_kwargs
+            )
+
+    def dumps_bytes(self, obj, *, many=None, native_types=True, ndjson=False, **kwargs):
+        """
+        Dump an object or a collection of objects to JSON `bytes`, or to newline delimited
+        JSON with `many` and `ndjson`. When orjson is installed, it encodes the data and,
+        with `native_types`, date, time and UUID values are passed to it without being
+        formatted to strings by the schema. Otherwise the schema `render_module` is used.
+        Additional keyword arguments are passed to `dump()`.
+        """
+        many = self.many if many is None else bool(many)
+        with call_context(native_types=native_types and orjson is not None):
+            data = self.dump(obj, many=many, **kwargs)
+
+        if many and ndjson:
+            return b''.join(self._encode_bytes(item) + b'\n' for item in data)
+        return self._encode_bytes(data)
+
+    def _encode_bytes(self, data):
+        if orjson is not None:
+            return orjson.dumps(data, default=_json_default)
+        if self.opts.render_module is json:
+            return json.dumps(data, default=_json_default).encode()
+        encoded = self.opts.render_module.dumps(data)
+        return encoded.encode() if isinstance(encoded, str) else encoded
+
+    def parallel_dump(self, queryset, **kwargs):
+        """
+        Dump a manager or queryset in worker processes, yielding encoded `bytes` chunks.
+        See `django_marshmallow.parallel.parallel_dump` for the keyword arguments.
+        """
+        if isinstance(queryset, models.Manager):
+            queryset = queryset.get_queryset()
+        return parallel_dump(self, queryset, **kwargs)
+
+    def loads_bytes(self, data, *, many=None, **kwargs):
+        """
+        Decode JSON `bytes` or `str` with orjson, or the schema `render_module` when orjson is
+        not installed, and load the result. Keyword arguments are passed to `load()`.
+        """
+        decoded = orjson.loads(data) if orjson is not None else self.opts.render_module.loads(data)
+        return self.load(decoded, many=many, **kwargs)
+
+    def get_values_columns(self):
+        """
+        Return a dict of schema field names to model fields read by `dump_values`, or `None`
+        when the schema dumps fields which cannot be read from `QuerySet.values()` rows.
+        """
+        if self._has_processors(PRE_DUMP) or self._has_processors(POST_DUMP):
+            return None
+
+        columns = self.dict_class()
+        for field_name, field in self.dump_fields.items():
+            if isinstance(field, Constant):
+                continue
+
+            if isinstance(field, RelatedNested) or field.attribute:
+                return None
+
+            try:
+                model_field = self.opts.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                return None
+
+            if isinstance(field, (RelatedPKField, RelatedField)):
+                if not (field.read_from_attname or self._get_m2m_pk_field(field)):
+                    return None
+            elif not model_field.concrete or model_field.is_relation:
+                return None
+            columns[field_name] = model_field
+        return columns
+
+    def dump_values(self, queryset, *, request=None, domain_for_file_urls=None):
+        """
+        Dump a manager or queryset from `QuerySet.values_list()` rows without instantiating
+        model objects. Foreign keys are read from their local columns and many-to-many
+        primary keys from one through table query per field. Falls back to `dump()` when
+        the schema has fields which need model instances, e.g. nested schemas.
+        """
+        columns = self.get_values_columns()
+        if columns is None:
+            return self.dump(queryset, many=True, request=request, domain_for_file_urls=domain_for_file_urls)
+
+        if isinstance(queryset, models.Manager):
+            queryset = queryset.get_queryset()
+            if self.opts.order_by:
+                queryset = queryset.order_by(*self.opts.order_by)
+
+        value_fields = []
+        m2m_fields = self.dict_class()
+        for field_name, model_field in columns.items():
+            if model_field.many_to_many:
+                m2m_fields[field_name] = self._get_m2m_pk_field(self.dump_fields[field_name])
+            else:
+                value_fields.append((field_name, model_field))
+
+        rows = []
+        source_pks = []
+        attnames = ['pk'] + [model_field.attname for _, model_field in value_fields]
+        for values in queryset.values_list(*attnames):
+            source_pks.append(values[0])
+            row = {}
+            for (field_name, model_field), value in zip(value_fields, values[1:]):
+                if isinstance(model_field, models.FileField):
+                    value = model_field.attr_class(None, model_field, value)
+                row[field_name] = value
+            rows.append(row)
+
+        for field_name, m2m_pk_field in m2m_fields.items():
+            m2m_pks = m2m_pk_field.get_m2m_pks(source_pks)
+            for source_pk, row in zip(source_pks, rows):
+                row[field_name] = m2m_pks[source_pk]
+
+        with call_context(request=request, domain_for_file_urls=domain_for_file_urls):
+            return super().dump(rows, many=True)
+
+    @cached_property
+    def compiled_dumper(self):
+        return compile_dumper(self)
+
+    @cached_property
+    def compiled_native_dumper(self):
+        return compile_dumper(self, native_types=True)
+
+    def _serialize(self, obj, *, many=False):
+        context = get_call_context()
+        if context is not None and context.native_types:
+            dumper = self.compiled_native_dumper
+        elif self.opts.compile_dump:
+            dumper = self.compiled_dumper
+        else:
+            dumper = None
+
+        if dumper is None:
+            return super()._serialize(obj, many=many)
+        if many and obj is not None:
+            return [dumper(o) for o in obj]
+        return dumper(obj)
+
+    @cached_property
+    def compiled_loader(self):
+        return compile_loader(self)
+
+    def _deserialize(self, data, *, error_store, many=False, partial=False, unknown=RAISE, index=None):
+        loader = self.compiled_loader if self.opts.compile_load else None
+        if loader is None or is_collection(partial):
+            return super()._deserialize(
+                data,
+                error_store=error_store,
+                many=many,
+                partial=partial,
+                unknown=unknown,
+                index=index
+            )
+
+        index = index if self.opts.index_errors else None
+        if many:
+            if not is_collection(data):
+                error_store.store_error([self.error_messages['type']], index=index)
+                return []
+            return [
+                self._deserialize(d, error_store=error_store, partial=partial, unknown=unknown, index=idx)
+                for idx, d in enumerate(data)
+            ]
+
+        if not isinstance(data, Mapping):
+            error_store.store_error([self.error_messages['type']], index=index)
+            return self.dict_class()
+        return loader(data, error_store, bool(partial), unknown, index)
+
+    def _get_load_state(self):
+        return get_schema_state(self) if self.shared else self.__dict__
+
+    def _set_load_state(self, **values):
+        if self.shared:
+            set_schema_state(self, **values)
+        else:
+            self.__dict__.update(values)
 
     @property
     def validated_data(self):
-        if not hasattr(self, '_validated_data'):
+        state = self._get_load_state()
+        if '_validated_data' not in state:
             raise AssertionError(
                 'You must call `.validate()` before accessing the schema `validated_data` attribute.'
             )
-        return self._validated_data
+        return state['_validated_data']
 
     @property
     def load_data(self):
-        if not hasattr(self, '_load_data'):
+        state = self._get_load_state()
+        if '_load_data' not in state:
             raise AssertionError(
                 'You must call `.load()` before accessing the schema `load_data` attribute.'
             )
-        return self._load_data
+        return state['_load_data']
+
+    def _get_related_pks_to_preload(self, data):
+        """
+        Return a list of `(related_pk_field, pks)` tuples of the related primary keys
+        referenced across a `many=True` payload.
+        """
+        if not isinstance(data, (list, tuple)):
+            return []
+
+        related_pks = []
+        for field_name, field in self.load_fields.items():
+            if isinstance(field, RelatedField):
+                related_pk_field = field.related_pk_field
+            elif isinstance(field, RelatedPKField):
+                related_pk_field = field
+            else:
+                continue
+
+            if not isinstance(related_pk_field, RelatedPKField) or related_pk_field.has_related_objects():
+                continue
 
-    def _do_load(self, data, **kwargs):
-        self._load_data = super()._do_load(data, **kwargs)
-        self._validated_data = data
-        return self._load_data
+            data_key = field.data_key if field.data_key is not None else field_name
+            pks = []
+            for item in data:
+                if isinstance(item, dict) and item.get(data_key) is not None:
+                    pks.extend(field.get_related_pks(item[data_key]))
+            related_pks.append((related_pk_field, pks))
+        return related_pks
 
-    def update(self, instance, validated_data=None, partial=True, **kwargs):
+    def _preload_related_objects(self, data):
+        """
+        Resolve related primary keys referenced across a `many=True` payload with one query
+        per related field. Returns the fields holding an identity map of the resolved objects.
+        """
+        related_pk_fields = []
+        for related_pk_field, pks in self._get_related_pks_to_preload(data):
+            related_pk_field.preload_related_objects(pks)
+            related_pk_fields.append(related_pk_field)
+        return related_pk_fields
+
+    async def _apreload_related_objects(self, data):
+        related_pk_fields = []
+        for related_pk_field, pks in self._get_related_pks_to_preload(data):
+            await related_pk_field.apreload_related_objects(pks)
+            related_pk_fields.append(related_pk_field)
+        return related_pk_fields
+
+    def load(self, data, *, many=None, partial=None, unknown=None, only=None, exclude=(), request=None):
+        """
+        Deserialize a data structure to an object. `only` and `exclude` limit the loaded
+        fields for this call.
+        """
+        if only is not None or exclude:
+            return self.get_scoped_schema(only, exclude).load(
+                data,
+                many=many,
+                partial=partial,
+                unknown=unknown,
+                request=request
+            )
+
+        with call_context(request=request):
+            return super().load(data, many=many, partial=partial, unknown=unknown)
+
+    def load_stream(
+            self,
+            source,
+            batch_size=1000,
+            *,
+            ndjson=False,
+            read_size=65536,
+            save=False,
+            partial=None,
+            unknown=None
+    ):
+        """
+        Incrementally load a JSON array, or newline delimited JSON when `ndjson` is set, from
+        a file-like object or an iterable of `bytes` chunks. Items are validated in batches
+        of `batch_size` and the valid items of every batch are yielded as a list, or saved
+        with `bulk_save` when `save` is set, in which case lists of created instances are
+        yielded. Once the source is exhausted, a `ValidationError` keyed by item index is
+        raised if any item was invalid.
+        """
+        items = iter_ndjson(source, read_size) if ndjson else iter_json_array(source, read_size)
+        errors = {}
+        batch = []
+        offset = 0
+        for item in items:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield self._load_stream_batch(batch, offset, errors, save, partial, unknown)
+                offset += len(batch)
+                batch = []
+        if batch:
+            yield self._load_stream_batch(batch, offset, errors, save, partial, unknown)
+
+        if errors:
+            raise ValidationError(errors)
+
+    def _load_stream_batch(self, batch, offset, errors, save, partial, unknown):
+        try:
+            load_data = self.load(batch, many=True, partial=partial, unknown=unknown)
+        except ValidationError as error:
+            batch_errors = error.messages if isinstance(error.messages, dict) else {'_schema': error.messages}
+            valid_indexes = [i for i in range(len(batch)) if i not in batch_errors]
+            for key, messages in batch_errors.items():
+                if isinstance(key, int):
+                    errors[offset + key] = messages
+                else:
+                    # errors of the whole batch invalidate all of its items
+                    errors.setdefault(key, []).append(messages)
+                    valid_indexes = []
+            batch = [batch[i] for i in valid_indexes]
+            load_data = [error.valid_data[i] for i in valid_indexes]
+
+        if save and load_data:
+            return self._bulk_save_load_data(batch, load_data, partial=partial, unknown=unknown)
+        return load_data
+
+    def _do_load(self, data, *, many=None, **kwargs):
+        many = self.many if many is None else bool(many)
+        with call_context():
+            related_pk_fields = self._preload_related_objects(data) if many else []
+            try:
+                load_data = super()._do_load(data, many=many, **kwargs)
+            finally:
+                for related_pk_field in related_pk_fields:
+                    related_pk_field.clear_related_objects()
+        self._set_load_state(_load_data=load_data, _validated_data=data)
+        return load_data
+
+    def update(self, instance, validated_data=None, partial=True, many=None, batch_size=None, **kwargs):
         """Update model instance fields with a `validated_data`"""
+        many = self.many if many is None else bool(many)
+        if many:
+            return self.bulk_update(
+                instance,
+                validated_data=validated_data,
+                partial=partial,
+                batch_size=batch_size,
+                **kwargs
+            )
+
         if not isinstance(instance, self.model_class):
             raise TypeError(f'`instance` parameter must be instance of `{self.model_class.__name__}` class.')
 
@@ -231,6 +986,67 @@ class BaseModelSchema(Schema, metaclass=ModelSchemaMetaclass):
             **kwargs
         )
 
+    def bulk_update(self, instances, validated_data=None, partial=True, batch_size=None, **kwargs):
+        """
+        Update a list or queryset of instances with the items of `validated_data` at the
+        same positions. Only the fields whose values changed are written, with one
+        `bulk_update` per set of changed fields in batches of `batch_size`. Model `save()`
+        methods and signals are not called.
+        """
+        instances = list(instances)
+        validated_data = self._check_bulk_update_args(instances, validated_data)
+        load_data = self.load(validated_data, many=True, partial=partial, **kwargs)
+
+        if any(related_name in data for data in load_data for related_name in self.related_nesteds):
+            # nested instances are saved through the nested schema of every item
+            return [
+                self.update(instance, vd, partial=partial, many=False, **kwargs)
+                for instance, vd in zip(instances, validated_data)
+            ]
+
+        updates = self._apply_bulk_updates(instances, load_data)
+        self._write_bulk_updates(updates, instances, load_data, batch_size=batch_size)
+        return instances
+
+    def _check_bulk_update_args(self, instances, validated_data):
+        if not validated_data:
+            validated_data = self.validated_data
+        if len(instances) != len(validated_data):
+            raise ValueError('`instances` and `validated_data` must have the same number of items.')
+        for instance in instances:
+            if not isinstance(instance, self.model_class):
+                raise TypeError(f'`instances` items must be instances of `{self.model_class.__name__}` class.')
+        return validated_data
+
+    def _apply_bulk_updates(self, instances, load_data):
+        """
+        Apply the load data to the instances and return the changed instances grouped by
+        the names of their changed fields.
+        """
+        auto_now_fields = [f for f in self.opts.model._meta.concrete_fields if getattr(f, 'auto_now', False)]
+        updates = {}
+        for instance, data in zip(instances, load_data):
+            # primary keys cannot be written with `bulk_update`
+            changed_fields = [f for f in update_instance(self, data, instance) if not f.primary_key]
+            if not changed_fields:
+                continue
+            changed_fields += [f for f in auto_now_fields if f not in changed_fields]
+            for f in changed_fields:
+                # stores uploaded files and sets `auto_now` values
+                f.pre_save(instance, False)
+            updates.setdefault(tuple(f.name for f in changed_fields), []).append(instance)
+        return updates
+
+    def _write_bulk_updates(self, updates, instances, load_data, batch_size=None):
+        manager = self.opts.model._default_manager
+        with transaction.atomic(using=manager.db):
+            for field_names, changed_instances in updates.items():
+                manager.bulk_update(changed_instances, field_names, batch_size=batch_size)
+            for instance, data in zip(instances, load_data):
+                for f in self._get_m2m_save_fields():
+                    if f.name in data:
+                        f.save_form_data(instance, data[f.name])
+
     def _save_m2m(self, instance, load_data=None):
         """
             Save the many-to-many fields and generic relations.
@@ -239,7 +1055,7 @@ class BaseModelSchema(Schema, metaclass=ModelSchemaMetaclass):
         def _save_from_data(instance, load_data):
             model_opts = instance._meta
             for f in chain(model_opts.many_to_many, model_opts.private_fields):
-                if f.name in self.related_fields:
+                if f.name in self.related_fields and f.name in load_data:
                     rel = self.related_fields[f.name]
                     if rel.many:
                         m2m_items = load_data[f.name]
@@ -251,8 +1067,85 @@ class BaseModelSchema(Schema, metaclass=ModelSchemaMetaclass):
             for data in load_data:
                 _save_from_data(instance, data)
 
-    def save(self, validated_data=None, many=None, instance=None, **kwargs):
+    def _save_partial(self, instance, load_data):
+        """
+            Save only the loaded concrete fields and the `auto_now` fields of an existing
+            instance. The write is skipped when no loaded value changed.
+        """
+        if not update_instance(self, load_data, instance):
+            return
+
+        # primary keys cannot be saved with `update_fields`
+        update_fields = [
+            f.name for f in instance._meta.concrete_fields
+            if not f.primary_key and (f.name in load_data or getattr(f, 'auto_now', False))
+        ]
+        instance.save(update_fields=update_fields)
+
+    def _get_m2m_save_fields(self):
+        """
+        Return the many-to-many model fields saved from the schema load data.
+        """
+        return [
+            f for f in self.opts.model._meta.many_to_many
+            if f.name in self.related_fields and self.related_fields[f.name].many
+        ]
+
+    def _bulk_save_m2m(self, instances, load_data, batch_size=None):
+        """
+            Insert the many-to-many relations of the given saved instances with one
+            `bulk_create` on the through model per relation.
+        """
+        for f in self._get_m2m_save_fields():
+            through = f.remote_field.through
+            source_attname = through._meta.get_field(f.m2m_field_name()).attname
+            target_attname = through._meta.get_field(f.m2m_reverse_field_name()).attname
+            through_objs = []
+            for instance, data in zip(instances, load_data):
+                related_pks = dict.fromkeys(related_obj.pk for related_obj in data.get(f.name) or ())
+                through_objs.extend(
+                    through(**{source_attname: instance.pk, target_attname: related_pk})
+                    for related_pk in related_pks
+                )
+            if through_objs:
+                through._default_manager.bulk_create(through_objs, batch_size=batch_size)
+
+    def bulk_save(self, validated_data=None, batch_size=None, **kwargs):
+        """
+        Load a list of items and insert them with `bulk_create` in batches of `batch_size`.
+        Many-to-many relations are inserted with one `bulk_create` per relation. Instances
+        are saved one by one when the database backend cannot return the primary keys of
+        bulk inserted rows and many-to-many relations have to be saved. Model `save()`
+        methods and signals are not called for bulk inserted rows.
+        """
+        if not validated_data:
+            validated_data = self.validated_data
+        load_data = self.load(validated_data, many=True, **kwargs)
+        return self._bulk_save_load_data(validated_data, load_data, batch_size=batch_size, **kwargs)
+
+    def _bulk_save_load_data(self, validated_data, load_data, batch_size=None, **kwargs):
+        if any(related_name in data for data in load_data for related_name in self.related_nesteds):
+            # nested instances are saved through the nested schema of every item
+            return [self.save(vd, many=False, **kwargs) for vd in validated_data]
+
+        instances = [construct_instance(schema=self, data=data) for data in load_data]
+        manager = self.opts.model._default_manager
+        db = manager.db
+        has_m2m_data = any(data.get(f.name) for data in load_data for f in self._get_m2m_save_fields())
+
+        with transaction.atomic(using=db):
+            if has_m2m_data and not connections[db].features.can_return_rows_from_bulk_insert:
+                for instance in instances:
+                    instance.save(using=db)
+            else:
+                manager.bulk_create(instances, batch_size=batch_size)
+            self._bulk_save_m2m(instances, load_data, batch_size=batch_size)
+        return instances
+
+    def save(self, validated_data=None, many=None, instance=None, bulk=False, batch_size=None, **kwargs):
         many = self.many if many is None else bool(many)
+        if many and bulk:
+            return self.bulk_save(validated_data, batch_size=batch_size, **kwargs)
         if not validated_data:
             validated_data = self.validated_data
         load_data = self.load(validated_data, many=many, **kwargs)
@@ -261,18 +1154,135 @@ class BaseModelSchema(Schema, metaclass=ModelSchemaMetaclass):
             for related_name, related_field in self.related_nesteds.items():
                 if related_name in load_data:
                     load_data[related_name] = related_field.schema.save()
-            instance = construct_instance(
-                schema=self,
-                data=load_data,
-                instance=instance
-            )
-            instance.save()
+            if kwargs.get('partial') and instance is not None and not instance._state.adding:
+                self._save_partial(instance, load_data)
+            else:
+                instance = construct_instance(
+                    schema=self,
+                    data=load_data,
+                    instance=instance
+                )
+                instance.save()
             self._save_m2m(instance, load_data)
         else:
             instance = [self.save(vd, many=False, **kwargs) for vd in validated_data]
 
         return instance
 
+    async def adump(self, obj, *, many=None, **kwargs):
+        """
+        Asynchronous `dump`. With the asynchronous ORM of Django 4.1+, querysets are fetched
+        with async iteration and serialized on the event loop. Other objects, and objects
+        whose serialization queries the database, are dumped with `sync_to_async`.
+        """
+        many = self.many if many is None else bool(many)
+        if (
+                ASYNC_ORM and many and isinstance(obj, (models.Manager, models.QuerySet))
+                and kwargs.get('only') is None and not kwargs.get('exclude')
+                and self.opts.optimize_queries and not self.opts.collect_m2m_pks
+        ):
+            queryset = self.prepare_queryset(obj)
+            objs = [o async for o in queryset]
+            try:
+                return self.dump(objs, many=True, **kwargs)
+            except SynchronousOnlyOperation:
+                # a field or hook accessed a relation which was not prefetched
+                return await sync_to_async(self.dump)(objs, many=True, **kwargs)
+        return await sync_to_async(self.dump)(obj, many=many, **kwargs)
+
+    async def aload(self, data, *, many=None, partial=None, unknown=None, only=None, exclude=(), request=None):
+        """
+        Asynchronous `load`. With the asynchronous ORM of Django 4.1+, related primary keys
+        are resolved with `ain_bulk` before the data is validated on the event loop.
+        """
+        if only is not None or exclude:
+            return await self.get_scoped_schema(only, exclude).aload(
+                data,
+                many=many,
+                partial=partial,
+                unknown=unknown,
+                request=request
+            )
+
+        many = self.many if many is None else bool(many)
+        load_kwargs = {'many': many, 'partial': partial, 'unknown': unknown}
+        if not ASYNC_ORM or self.related_nesteds:
+            return await sync_to_async(self.load)(data, request=request, **load_kwargs)
+
+        # the preloaded related objects are kept in this call context, which `load` and
+        # `sync_to_async` reuse as long as no request is passed to them
+        with call_context(request=request):
+            related_pk_fields = await self._apreload_related_objects(data if many else [data])
+            try:
+                return self.load(data, **load_kwargs)
+            except SynchronousOnlyOperation:
+                # a field or validator queried the database
+                return await sync_to_async(self.load)(data, **load_kwargs)
+            finally:
+                for related_pk_field in related_pk_fields:
+                    related_pk_field.clear_related_objects()
+
+    async def asave(self, validated_data=None, many=None, instance=None, bulk=False, batch_size=None, **kwargs):
+        """
+        Asynchronous `save`. With the asynchronous ORM of Django 4.1+, bulk saves without
+        nested or many-to-many data are inserted with `abulk_create`. Other saves need a
+        transaction or nested schema saves and run with `sync_to_async`.
+        """
+        many = self.many if many is None else bool(many)
+        if not (ASYNC_ORM and many and bulk and not self.related_nesteds):
+            return await sync_to_async(self.save)(
+                validated_data,
+                many=many,
+                instance=instance,
+                bulk=bulk,
+                batch_size=batch_size,
+                **kwargs
+            )
+
+        if not validated_data:
+            validated_data = self.validated_data
+        load_data = await self.aload(validated_data, many=True, **kwargs)
+        if any(data.get(f.name) for data in load_data for f in self._get_m2m_save_fields()):
+            return await sync_to_async(self._bulk_save_load_data)(
+                validated_data,
+                load_data,
+                batch_size=batch_size,
+                **kwargs
+            )
+
+        instances = [construct_instance(schema=self, data=data) for data in load_data]
+        return await self.opts.model._default_manager.abulk_create(instances, batch_size=batch_size)
+
+    async def aupdate(self, instance, validated_data=None, partial=True, many=None, batch_size=None, **kwargs):
+        """
+        Asynchronous `update`. With the asynchronous ORM of Django 4.1+, bulk updates which
+        change a single set of fields and no many-to-many relations are written with
+        `abulk_update`. Other updates run with `sync_to_async`.
+        """
+        many = self.many if many is None else bool(many)
+        update_kwargs = {'partial': partial, 'many': many, 'batch_size': batch_size, **kwargs}
+        if not (ASYNC_ORM and many and not self.related_nesteds):
+            return await sync_to_async(self.update)(instance, validated_data, **update_kwargs)
+
+        if isinstance(instance, (models.Manager, models.QuerySet)):
+            instances = [i async for i in instance.all()]
+        else:
+            instances = list(instance)
+        validated_data = self._check_bulk_update_args(instances, validated_data)
+        load_data = await self.aload(validated_data, many=True, partial=partial, **kwargs)
+
+        updates = self._apply_bulk_updates(instances, load_data)
+        if len(updates) > 1 or any(f.name in data for data in load_data for f in self._get_m2m_save_fields()):
+            await sync_to_async(self._write_bulk_updates)(updates, instances, load_data, batch_size=batch_size)
+        else:
+            for field_names, changed_instances in updates.items():
+                await self.opts.model._default_manager.abulk_update(
+                    changed_instances,
+                    field_names,
+                    batch_size=batch_size
+                )
+        return instances
+
     def handle_error(self, error: ValidationError, data: typing.Any, *, many: bool, **kwargs):
         error_message_overrides = self.opts.error_message_overrides or {}
         handled_errors = {}
@@ -305,11 +1315,65 @@ class ModelSchema(BaseModelSchema):
     pass
 
 
+def _json_default(value):
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f'Type is not JSON serializable: {type(value).__name__}')
+
+
+def _freeze(value):
+    """
+    Return a hashable version of a `modelschema_factory` argument.
+    """
+    if isinstance(value, dict):
+        return dict, tuple((key, _freeze(val)) for key, val in value.items())
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_freeze(val) for val in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(val) for val in value)
+    hash(value)
+    return value
+
+
+_schema_factory_cache = OrderedDict()
+_schema_factory_cache_lock = threading.Lock()
+
+
 def modelschema_factory(model, schema=ModelSchema, fields=None, exclude=None, **kwargs):
     """
         Return a ModelSchema containing schema fields for the given model.
+
+        Schema classes are cached by their arguments, so identical nested schemas are
+        created once. The cache is bounded by the `SCHEMA_FACTORY_CACHE_SIZE` setting and
+        can be emptied with `modelschema_factory.cache_clear()`.
     """
-    attrs = {'model': model}
+    from django_marshmallow.settings import ma_settings
+
+    cache_size = ma_settings.SCHEMA_FACTORY_CACHE_SIZE
+    try:
+        key = _freeze((model, schema, fields, exclude, kwargs))
+    except TypeError:
+        key = None
+
+    if key is not None and cache_size:
+        with _schema_factory_cache_lock:
+            schema_class = _schema_factory_cache.get(key)
+            if schema_class is not None:
+                _schema_factory_cache.move_to_end(key)
+                return schema_class
+
+    schema_class = _create_modelschema(model, schema, fields, exclude, **kwargs)
+
+    if key is not None and cache_size:
+        with _schema_factory_cache_lock:
+            schema_class = _schema_factory_cache.setdefault(key, schema_class)
+            while len(_schema_factory_cache) > cache_size:
+                _schema_factory_cache.popitem(last=False)
+    return schema_class
+
+
+def _create_modelschema(model, schema, fields, exclude, **kwargs):
+    attrs = {'model': model, 'register': False}
     if fields is not None:
         attrs['fields'] = fields
     if exclude is not None:
@@ -333,3 +1397,17 @@ def modelschema_factory(model, schema=ModelSchema, fields=None, exclude=None, **
         )
 
     return type(schema)(class_name, (schema,), schema_class_attrs)
+
+
+def _clear_schema_factory_cache(*args, **kwargs):
+    with _schema_factory_cache_lock:
+        _schema_factory_cache.clear()
+
+
+def _reset_schema_factory_cache(*args, **kwargs):
+    if kwargs['setting'] == 'MARSHMALLOW_SETTINGS':
+        _clear_schema_factory_cache()
+
+
+modelschema_factory.cache_clear = _clear_schema_factory_cache
+setting_changed.connect(_reset_schema_factory_cache)
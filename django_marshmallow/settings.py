@@ -21,6 +21,14 @@ DEFAULTS = {
     'SHOW_SELECT_OPTIONS': False,
     'USE_FILE_URL': True,
     'DOMAIN_FOR_FILE_URLS': None,
+    'VERIFY_IMAGES': True,
+    'OPTIMIZE_QUERIES': True,
+    'COLLECT_M2M_PKS': False,
+    'COMPILE_DUMP': False,
+    'COMPILE_LOAD': False,
+    'SCHEMA_FACTORY_CACHE_SIZE': 512,
+    'SCOPED_SCHEMA_CACHE_SIZE': 128,
+    'COMPILED_SCHEMA_CACHE_SIZE': 32,
     'MISSING': None,
     'DEFAULT': None,
 }
@@ -1,6 +1,11 @@
+import codecs
+import json
+import re
 from collections import OrderedDict, namedtuple
+from weakref import WeakKeyDictionary
 
 from django.db.models import FileField
+from django.db.models.signals import class_prepared
 
 FieldInfo = namedtuple('FieldResult', [
     'relations',
@@ -17,14 +22,35 @@ RelationInfo = namedtuple('RelationInfo', [
 ])
 
 
+# Field infos keyed by concrete model class, emptied whenever a model class is prepared
+# because a new model can add reverse relations to the existing ones.
+_field_info_cache = WeakKeyDictionary()
+
+
 def get_field_info(model):
     """
     Given a model class, returns a `FieldInfo` instance, which is a
     `namedtuple`, containing metadata about the various field types on the model
     including information about their relationships.
+
+    The result is cached per model and can be emptied with `get_field_info.cache_clear()`.
     """
-    opts = model._meta.concrete_model._meta
+    concrete_model = model._meta.concrete_model
+    field_info = _field_info_cache.get(concrete_model)
+    if field_info is None:
+        field_info = _field_info_cache[concrete_model] = _build_field_info(concrete_model._meta)
+    return field_info
+
+
+def _clear_field_info_cache(**kwargs):
+    _field_info_cache.clear()
+
+
+get_field_info.cache_clear = _clear_field_info_cache
+class_prepared.connect(_clear_field_info_cache)
+
 
+def _build_field_info(opts):
     pk = _get_pk(opts)
     fields = _get_fields(opts)
     forward_relations = _get_forward_relationships(opts)
@@ -151,6 +177,19 @@ def is_abstract_model(model):
     return hasattr(model, '_meta') and hasattr(model._meta, 'abstract') and model._meta.abstract
 
 
+def get_default_ordering(model):
+    """
+    Return the ordering of the default manager of a model, or its primary key when the
+    default manager is not ordered. Dumped to-many relations are ordered with it.
+    """
+    query = model._default_manager.all().query
+    if query.order_by:
+        return list(query.order_by)
+    if query.default_ordering and model._meta.ordering:
+        return list(model._meta.ordering)
+    return ['pk']
+
+
 def construct_instance(schema, data, instance=None):
     """
     Construct and return a model instance from the bound ``schema``'s
@@ -174,3 +213,153 @@ def construct_instance(schema, data, instance=None):
         file_field.save_form_data(instance, data[file_field.name])
 
     return instance
+
+
+def update_instance(schema, data, instance):
+    """
+    Apply the bound ``schema``'s ``load_data`` to ``instance`` like `construct_instance`
+    and return the list of model fields whose values changed. Fields receiving a new,
+    not yet stored file are always reported as changed.
+    """
+    model_fields = [f for f in instance._meta.fields if f.name in data]
+    old_values = [f.value_from_object(instance) for f in model_fields]
+    construct_instance(schema=schema, data=data, instance=instance)
+
+    changed_fields = []
+    for f, old_value in zip(model_fields, old_values):
+        new_value = f.value_from_object(instance)
+        if isinstance(f, FileField) and not getattr(new_value, '_committed', True):
+            changed_fields.append(f)
+        elif new_value != old_value:
+            changed_fields.append(f)
+    return changed_fields
+
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_NUMBER_CHARS = re.compile(r'[0-9.eE+-]*')
+_JSON_CONSTANTS = ('true', 'false', 'null', 'NaN', 'Infinity', '-Infinity')
+
+
+def _iter_text(source, read_size):
+    """
+    Yield text chunks of a file-like object or an iterable of `bytes` or `str` chunks.
+    Bytes are decoded as UTF-8, also when a character is split between chunks.
+    """
+    if hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(read_size), source.read(0))
+    else:
+        chunks = source
+
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        if isinstance(chunk, (bytes, bytearray)):
+            chunk = decoder.decode(chunk)
+        if chunk:
+            yield chunk
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+
+def _is_truncated(error, buffer):
+    """
+    Return True if the JSON decode error of a buffer may be resolved by more data, False
+    if the buffer is malformed.
+    """
+    if error.pos >= len(buffer) or error.msg.startswith('Unterminated string'):
+        return True
+    rest = buffer[error.pos:]
+    if error.msg == 'Expecting value':
+        return any(constant.startswith(rest) for constant in _JSON_CONSTANTS)
+    if error.msg.startswith('Invalid \\uXXXX escape'):
+        return len(rest) < 6
+    return False
+
+
+def iter_json_array(source, read_size=65536):
+    """
+    Incrementally parse a JSON array from a file-like object or an iterable of chunks and
+    yield its items. Only the item being parsed is kept in memory. Malformed items raise
+    a `ValueError` without reading the rest of the source.
+    """
+    decoder = json.JSONDecoder()
+    chunks = _iter_text(source, read_size)
+    buffer = ''
+    pos = 0
+    eof = False
+    expect = '['
+
+    def read(buffer, min_size):
+        # returns the buffer extended by at least `min_size` characters and the end of file flag
+        parts = [buffer]
+        size = 0
+        while size < min_size:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return ''.join(parts), True
+            parts.append(chunk)
+            size += len(chunk)
+        return ''.join(parts), False
+
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                raise ValueError('Unexpected end of the JSON array.')
+            buffer, eof = read('', 1)
+            pos = 0
+            continue
+
+        char = buffer[pos]
+        if expect == '[':
+            if char != '[':
+                raise ValueError('The JSON document is not an array.')
+            pos += 1
+            expect = 'first'
+            continue
+        if expect in ('first', ',') and char == ']':
+            return
+        if expect == ',':
+            if char != ',':
+                raise ValueError(f'Expecting "," delimiter at position {pos} of the JSON array chunk.')
+            pos += 1
+            expect = 'item'
+            continue
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as error:
+            if eof or not _is_truncated(error, buffer):
+                raise
+            end = None
+
+        # an item is complete once it is followed by a delimiter, numbers may continue in the next chunk
+        if not eof and (
+                end is None or end == len(buffer)
+                or (type(item) in (int, float) and _NUMBER_CHARS.match(buffer, end).end() == len(buffer))
+        ):
+            # the buffered part of the item at least doubles, so large items are parsed
+            # a logarithmic number of times
+            buffer, eof = read(buffer[pos:], max(len(buffer) - pos, read_size))
+            pos = 0
+            continue
+
+        pos = end
+        expect = ','
+        yield item
+
+
+def iter_ndjson(source, read_size=65536):
+    """
+    Incrementally parse newline delimited JSON from a file-like object or an iterable of
+    chunks and yield its items. Blank lines are skipped.
+    """
+    rest = ''
+    for chunk in _iter_text(source, read_size):
+        lines = (rest + chunk).split('\n')
+        rest = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+    if rest.strip():
+        yield json.loads(rest)
@@ -5,6 +5,7 @@ from datetime import datetime
 from decimal import Decimal
 from PIL import Image
 from io import BytesIO
+from itertools import islice
 from types import SimpleNamespace
 
 import django
@@ -14,7 +15,9 @@ from django.core.files import File
 from django.conf import settings
 
 import pytest
-from django.db import transaction
+from asgiref.sync import sync_to_async
+from django.db import connections, transaction
+from django.db.models import Manager, QuerySet
 
 
 def pytest_report_header(config):
@@ -246,3 +249,83 @@ def limited_related_choices_obj(db, db_models):
     simple_obj.save()
     return simple_obj
 
+
+async def _ain_bulk(self, id_list=None, *, field_name='pk'):
+    return await sync_to_async(self.in_bulk)(id_list=id_list, field_name=field_name)
+
+
+async def _abulk_create(self, objs, *args, **kwargs):
+    return await sync_to_async(self.bulk_create)(objs, *args, **kwargs)
+
+
+async def _abulk_update(self, objs, fields, batch_size=None):
+    return await sync_to_async(self.bulk_update)(objs, fields, batch_size=batch_size)
+
+
+def _aiter(self):
+    async def generator():
+        await sync_to_async(self._fetch_all)()
+        for item in self._result_cache:
+            yield item
+    return generator()
+
+
+async def _aiterator(self, chunk_size=2000):
+    iterator = self.iterator(chunk_size=chunk_size)
+    while True:
+        chunk = await sync_to_async(list)(islice(iterator, chunk_size))
+        if not chunk:
+            break
+        for item in chunk:
+            yield item
+
+
+@pytest.fixture
+def async_orm(monkeypatch):
+    """
+    Run the schema async methods on the asynchronous queryset API. On Django versions
+    without it, the queryset methods are added with the implementation of Django 4.1.
+    Yields the list of the functions which fell back to `sync_to_async`.
+    """
+    from django_marshmallow import schemas
+
+    if not hasattr(QuerySet, 'ain_bulk'):
+        for name, method in (
+            ('ain_bulk', _ain_bulk),
+            ('abulk_create', _abulk_create),
+            ('abulk_update', _abulk_update),
+            ('aiterator', _aiterator),
+        ):
+            monkeypatch.setattr(QuerySet, name, method, raising=False)
+            monkeypatch.setattr(Manager, name, method, raising=False)
+        monkeypatch.setattr(QuerySet, '__aiter__', _aiter, raising=False)
+        monkeypatch.setattr(schemas, 'ASYNC_ORM', True)
+
+    fallbacks = []
+
+    def spy_sync_to_async(func, *args, **kwargs):
+        fallbacks.append(getattr(func, '__name__', func))
+        return sync_to_async(func, *args, **kwargs)
+
+    monkeypatch.setattr(schemas, 'sync_to_async', spy_sync_to_async)
+    yield fallbacks
+
+
+@pytest.fixture
+def file_db(transactional_db, tmp_path, db_models):
+    """
+    Switch the default database to a sqlite file with the test model tables, which is
+    also opened by worker processes forked during the test.
+    """
+    original_connection = connections['default']
+    settings_dict = {**original_connection.settings_dict, 'NAME': str(tmp_path / 'db.sqlite3')}
+    file_connection = type(original_connection)(settings_dict, 'default')
+    connections['default'] = file_connection
+    try:
+        with file_connection.schema_editor() as editor:
+            for model_class in vars(db_models).values():
+                editor.create_model(model_class)
+        yield
+    finally:
+        connections['default'].close()
+        connections['default'] = original_connection
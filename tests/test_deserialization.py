@@ -1,4 +1,16 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from itertools import chain
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from marshmallow import EXCLUDE, ValidationError
+
 from django_marshmallow import fields
+from django_marshmallow.fields import ImageField
 from django_marshmallow.schemas import ModelSchema
 from tests.models import DECIMAL_CHOICES
 
@@ -302,6 +314,33 @@ def test_file_field_deserialization(db_models, uploaded_file_obj, uploaded_image
     assert data['image_field'].name == uploaded_image_file_obj.name
 
 
+@pytest.mark.parametrize('verify', [True, False])
+def test_image_field_deserialization(db_models, uploaded_file_obj, uploaded_image_file_obj, verify):
+
+    class TestSchema(ModelSchema):
+
+        class Meta:
+            model = db_models.FileFieldModel
+            fields = ('image_field',)
+            verify_images = verify
+
+    schema = TestSchema()
+    data = schema.load({'image_field': uploaded_image_file_obj})
+    assert data['image_field'].name == uploaded_image_file_obj.name
+    assert data['image_field'].image.format == 'JPEG'
+    assert data['image_field'].image.size == (400, 400)
+    assert data['image_field'].content_type == 'image/jpeg'
+
+    # the form field is built on the first load and reused
+    formfield = schema.fields['image_field'].formfield
+    schema.load({'image_field': uploaded_image_file_obj})
+    assert schema.fields['image_field'].formfield is formfield
+
+    uploaded_file_obj.name = 'test_image.jpg'
+    errors = schema.validate({'image_field': uploaded_file_obj})
+    assert errors == {'image_field': [ImageField.default_error_messages['invalid_image']]}
+
+
 def test_related_field_with_limited_choices_deserialization(db_models, limited_related_choices_obj):
     class TestSchema(ModelSchema):
 
@@ -320,3 +359,343 @@ def test_related_field_with_limited_choices_deserialization(db_models, limited_r
     data = schema.load(load_data)
     assert len(data) == 1
     assert data['foreign_key_field'] == choice
+
+
+def test_many_to_many_related_pks_resolved_with_single_query(
+        db,
+        db_models,
+        django_assert_num_queries
+):
+    m2m_instances = db_models.ManyToManyTarget.objects.bulk_create([
+        db_models.ManyToManyTarget(name=f'Many to Many {i}') for i in range(5)
+    ])
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('many_to_many_field',)
+            expand_related_pk_fields = False
+
+    schema = TestSchema()
+    # input order and duplicates are kept
+    pks = [str(m.pk) for m in reversed(m2m_instances)] + [str(m2m_instances[0].pk)]
+
+    with django_assert_num_queries(1):
+        data = schema.load({'many_to_many_field': pks})
+
+    assert [str(m.pk) for m in data['many_to_many_field']] == pks
+
+
+def test_related_objects_resolved_once_for_many_loads(
+        db,
+        db_models,
+        django_assert_num_queries
+):
+    fk_instances = [
+        db_models.ForeignKeyTarget.objects.create(name=f'Foreign Key {i}') for i in range(3)
+    ]
+    m2m_instances = db_models.ManyToManyTarget.objects.bulk_create([
+        db_models.ManyToManyTarget(name=f'Many to Many {i}') for i in range(3)
+    ])
+    o2o_instances = db_models.OneToOneTarget.objects.bulk_create([
+        db_models.OneToOneTarget(name=f'One to One {i}') for i in range(3)
+    ])
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'foreign_key_field', 'many_to_many_field', 'one_to_one_field')
+
+    schema = TestSchema()
+    load_data = [
+        {
+            'name': f'Deserialized Instance {i}',
+            'foreign_key_field': {'id': fk_instances[i].id},
+            'one_to_one_field': {'uuid': str(o2o_instances[i].uuid)},
+            'many_to_many_field': [{'uuid': str(m.uuid)} for m in m2m_instances[:i + 1]]
+        }
+        for i in range(3)
+    ]
+
+    # one query per related field, regardless of the number of rows
+    with django_assert_num_queries(3):
+        deserialized_data = schema.load(load_data, many=True)
+
+    for i, data in enumerate(deserialized_data):
+        assert data['foreign_key_field'] == fk_instances[i]
+        assert data['one_to_one_field'] == o2o_instances[i]
+        assert data['many_to_many_field'] == m2m_instances[:i + 1]
+
+    # related objects are shared between rows through the identity map
+    assert deserialized_data[0]['many_to_many_field'][0] is deserialized_data[2]['many_to_many_field'][0]
+
+
+def test_compiled_load_deserialization(db, db_models):
+    load_fields = (
+        'big_integer_field', 'boolean_field', 'char_field', 'date_field', 'decimal_field',
+        'float_field', 'integer_field', 'null_boolean_field', 'text_field_blank_true'
+    )
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = load_fields
+
+    class CompiledTestSchema(ModelSchema):
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = load_fields
+            compile_load = True
+
+    valid_data = {
+        'big_integer_field': 100000000,
+        'boolean_field': True,
+        'char_field': 'Char Field',
+        'date_field': '2020-01-01',
+        'decimal_field': '1.5',
+        'float_field': 1.5,
+        'integer_field': 2,
+        'null_boolean_field': None,
+        'text_field_blank_true': '',
+    }
+    invalid_data = [
+        valid_data,
+        {**valid_data, 'integer_field': 3, 'char_field': 1, 'unknown_field': 'value'},
+        {'big_integer_field': 'invalid', 'boolean_field': None},
+        'invalid',
+    ]
+
+    schema = TestSchema()
+    compiled_schema = CompiledTestSchema()
+    assert compiled_schema.compiled_loader is not None
+
+    assert compiled_schema.load(valid_data) == schema.load(valid_data)
+    assert compiled_schema.load({'integer_field': 4}, partial=True) == {'integer_field': 4}
+
+    with pytest.raises(ValidationError) as error:
+        schema.load(invalid_data, many=True)
+    with pytest.raises(ValidationError) as compiled_error:
+        compiled_schema.load(invalid_data, many=True)
+
+    assert compiled_error.value.messages == error.value.messages
+    assert compiled_error.value.valid_data == error.value.valid_data
+
+
+def test_shared_schema_load_data_per_thread(db_models):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    schema = TestSchema(shared=True)
+
+    def load(name):
+        data = schema.load({'name': name, 'text': 'text'}, only=('name',), unknown=EXCLUDE)
+        return data, schema.get_scoped_schema(('name',)).load_data
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        names = [f'Name {i}' for i in range(8)]
+        results = list(executor.map(load, names))
+
+    for name, (data, load_data) in zip(names, results):
+        assert data == load_data == {'name': name}
+
+    with pytest.raises(AssertionError):
+        schema.load_data
+
+
+def test_shared_schema_load_data_per_task(db_models):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    schema = TestSchema(shared=True)
+
+    async def load(name):
+        data = schema.load({'name': name, 'text': 'text'})
+        await asyncio.sleep(0)
+        return data, schema.load_data
+
+    async def load_concurrently(names):
+        # the parent task holds a load state before the tasks are created
+        schema.load({'name': 'Parent', 'text': 'text'})
+        results = await asyncio.gather(*(load(name) for name in names))
+        return results, schema.load_data
+
+    names = [f'Name {i}' for i in range(4)]
+    results, parent_load_data = async_to_sync(load_concurrently)(names)
+
+    for name, (data, load_data) in zip(names, results):
+        assert data == load_data == {'name': name, 'text': 'text'}
+    assert parent_load_data == {'name': 'Parent', 'text': 'text'}
+
+
+def test_scoped_schema_cache_size(db_models, settings):
+    settings.MARSHMALLOW_SETTINGS = {'SCOPED_SCHEMA_CACHE_SIZE': 2}
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('id', 'name', 'text')
+
+    schema = TestSchema(shared=True)
+    name_schema = schema.get_scoped_schema(('name',))
+    schema.get_scoped_schema(('text',))
+    assert schema.get_scoped_schema(('name',)) is name_schema
+
+    # the least recently used field selection is dropped
+    schema.get_scoped_schema(('id',))
+    assert len(schema._scoped_schemas) == 2
+    assert schema.get_scoped_schema(('name',)) is name_schema
+    assert schema.get_scoped_schema(('text',)).only == {'text'}
+
+
+def test_compiled_loader_cache_size(db_models, settings):
+    settings.MARSHMALLOW_SETTINGS = {'COMPILED_SCHEMA_CACHE_SIZE': 2}
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+            compile_load = True
+
+    factories = TestSchema._compiled_loader_factories
+    assert TestSchema(only=('name',)).compiled_loader is not None
+    TestSchema(only=('text',)).compiled_loader
+    name_factory = next(iter(factories.values()))
+    TestSchema(only=('name',)).compiled_loader
+
+    # the least recently used field layout is dropped
+    TestSchema(only=('name', 'text')).compiled_loader
+    assert len(factories) == 2
+    assert name_factory in factories.values()
+    assert TestSchema(only=('text',)).load({'text': 'Text'}) == {'text': 'Text'}
+
+
+def test_stream_deserialization(db, db_models):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = ('char_field', 'integer_field')
+
+    items = [{'char_field': f'Char Field {i}', 'integer_field': i * 2} for i in range(7)]
+    items[2]['integer_field'] = 3
+    items[5]['char_field'] = ''
+    schema = TestSchema()
+
+    for source, ndjson in (
+        (BytesIO(json.dumps(items, indent=2).encode()), False),
+        (BytesIO('\n'.join(json.dumps(item) for item in items).encode()), True),
+    ):
+        batches = []
+        with pytest.raises(ValidationError) as error:
+            for batch in schema.load_stream(source, batch_size=3, ndjson=ndjson, read_size=7):
+                batches.append(batch)
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert list(chain(*batches)) == [item for i, item in enumerate(items) if i not in (2, 5)]
+        assert sorted(error.value.messages) == [2, 5]
+
+    class SaveSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name',)
+
+    chunks = [b'[{"name": "Inst', b'ance 1"}, {"name": "Instance 2"}', b']']
+    instances = list(chain(*SaveSchema().load_stream(chunks, save=True)))
+    assert [instance.name for instance in instances] == ['Instance 1', 'Instance 2']
+    assert db_models.SimpleTestModel.objects.count() == 2
+
+
+def test_stream_deserialization_of_invalid_json(db_models):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name',)
+
+    schema = TestSchema()
+
+    # truncated item
+    chunks = [b'[{"name": "Instance 1"}, {"na', b'me": "Inst']
+    with pytest.raises(ValueError):
+        list(schema.load_stream(chunks))
+
+    # malformed item, the rest of the source is not read
+    read_chunks = []
+
+    def iter_chunks():
+        yield b'[{"name": "Instance 1"}, {"name": Instance 2}'
+        for i in range(10000):
+            read_chunks.append(i)
+            yield b', {"name": "Instance"}'
+
+    with pytest.raises(ValueError):
+        list(schema.load_stream(iter_chunks()))
+    assert len(read_chunks) <= 1
+
+
+def test_async_deserialization(db, db_models):
+    fk_instances = [
+        db_models.ForeignKeyTarget.objects.create(name=f'Foreign Key {i}') for i in range(2)
+    ]
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'foreign_key_field')
+
+    schema = TestSchema()
+    load_data = [
+        {'name': f'Deserialized Instance {i}', 'foreign_key_field': {'id': fk_instance.id}}
+        for i, fk_instance in enumerate(fk_instances)
+    ]
+
+    deserialized_data = async_to_sync(schema.aload)(load_data, many=True)
+    assert [data['foreign_key_field'] for data in deserialized_data] == fk_instances
+    assert schema.load_data == deserialized_data
+
+    data = async_to_sync(schema.aload)(
+        {'foreign_key_field': {'id': fk_instances[0].id}},
+        only=('foreign_key_field',)
+    )
+    assert data == {'foreign_key_field': fk_instances[0]}
+
+    with pytest.raises(ValidationError) as exc_info:
+        async_to_sync(schema.aload)({'name': 'Invalid', 'foreign_key_field': {'id': 0}})
+    assert 'foreign_key_field' in exc_info.value.messages
+
+
+def test_async_orm_deserialization(db, db_models, async_orm, django_assert_num_queries):
+    fk_instances = [
+        db_models.ForeignKeyTarget.objects.create(name=f'Foreign Key {i}') for i in range(2)
+    ]
+    m2m_instances = db_models.ManyToManyTarget.objects.bulk_create([
+        db_models.ManyToManyTarget(name=f'Many to Many {i}') for i in range(2)
+    ])
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'foreign_key_field', 'many_to_many_field')
+
+    schema = TestSchema()
+    load_data = [
+        {
+            'name': f'Deserialized Instance {i}',
+            'foreign_key_field': {'id': fk_instance.id},
+            'many_to_many_field': [{'uuid': str(m.uuid)} for m in m2m_instances]
+        }
+        for i, fk_instance in enumerate(fk_instances)
+    ]
+    request = RequestFactory().get('/')
+
+    # one `ain_bulk` query per related field and load
+    with django_assert_num_queries(4):
+        deserialized_data = async_to_sync(schema.aload)(load_data, many=True, request=request)
+        data = async_to_sync(schema.aload)(load_data[0], request=request)
+    assert [data['foreign_key_field'] for data in deserialized_data] == fk_instances
+    assert data['many_to_many_field'] == m2m_instances
+
+    # related objects are loaded on the event loop
+    assert async_orm == []
@@ -1,8 +1,10 @@
 import pytest
 from django.core.exceptions import ImproperlyConfigured
+from django.db.models.signals import class_prepared
 
 from django_marshmallow import fields
-from django_marshmallow.schemas import ModelSchema
+from django_marshmallow.schemas import ModelSchema, modelschema_factory
+from django_marshmallow.utils import get_field_info
 
 
 class TestModelSchemaOptions:
@@ -144,6 +146,46 @@ class TestModelSchemaFieldConverter:
         schema_field_names = list(schema.fields.keys())
         assert sorted(schema_field_names) == sorted(model_field_names)
 
+    def test_schema_instance_field_binding(self, db_models):
+        class TestModelSchema(ModelSchema):
+            class Meta:
+                model = db_models.AllRelatedFieldsModel
+                fields = ('name', 'foreign_key_field', 'many_to_many_field')
+                nested_fields = ('many_to_many_field',)
+
+        schema = TestModelSchema()
+        other_schema = TestModelSchema()
+
+        name_field = schema.fields['name']
+        declared_name_field = TestModelSchema._declared_fields['name']
+        assert name_field is not declared_name_field
+        assert name_field.model_field is declared_name_field.model_field
+        assert name_field.validators is not other_schema.fields['name'].validators
+        assert name_field.validators == declared_name_field.validators
+
+        related_field = schema.fields['foreign_key_field']
+        assert related_field.related_pk_field is not other_schema.fields['foreign_key_field'].related_pk_field
+        assert related_field.related_pk_field.queryset is TestModelSchema._declared_fields[
+            'foreign_key_field'].related_pk_field.queryset
+
+        assert schema.fields['many_to_many_field'].schema is not other_schema.fields['many_to_many_field'].schema
+        assert list(schema.related_fields) == ['foreign_key_field', 'many_to_many_field']
+        assert list(schema.related_nesteds) == ['many_to_many_field']
+        assert list(TestModelSchema(only=('name', 'foreign_key_field')).related_fields) == ['foreign_key_field']
+
+    def test_model_field_info_cache(self, db_models):
+        field_info = get_field_info(db_models.SimpleRelationsModel)
+        assert get_field_info(db_models.SimpleRelationsModel) is field_info
+
+        get_field_info.cache_clear()
+        new_field_info = get_field_info(db_models.SimpleRelationsModel)
+        assert new_field_info is not field_info
+        assert list(new_field_info.all_fields) == list(field_info.all_fields)
+
+        # a new model class can add reverse relations
+        class_prepared.send(sender=db_models.SimpleTestModel)
+        assert get_field_info(db_models.SimpleRelationsModel) is not new_field_info
+
     def test_generated_related_schema_fields(self, db_models):
         class TestModelSchema(ModelSchema):
             class Meta:
@@ -220,3 +262,26 @@ class TestModelSchemaFieldConverter:
         second_depth_relation_model_field_names = [f.name for f in second_depth_relation_model._meta.fields]
         second_depth_nested_schema_field_names = list(second_depth_nested_schema.fields.keys())
         assert sorted(second_depth_relation_model_field_names) == sorted(second_depth_nested_schema_field_names)
+
+    def test_generated_nested_schemas_are_cached(self, db_models):
+        class TestModelSchema(ModelSchema):
+            class Meta:
+                model = db_models.SimpleRelationsModel
+                fields = '__all__'
+                depth = 2
+
+        class OtherTestModelSchema(ModelSchema):
+            class Meta:
+                model = db_models.SimpleRelationsModel
+                fields = ('many_to_many_field',)
+                depth = 2
+
+        nested_field = TestModelSchema._declared_fields['many_to_many_field']
+        other_nested_field = OtherTestModelSchema._declared_fields['many_to_many_field']
+        assert nested_field.nested is other_nested_field.nested
+        schema_class = modelschema_factory(db_models.ForeignKeyTarget, fields=['name'])
+        assert modelschema_factory(db_models.ForeignKeyTarget, fields=['name']) is schema_class
+        assert schema_class.Meta.register is False
+
+        modelschema_factory.cache_clear()
+        assert modelschema_factory(db_models.ForeignKeyTarget, fields=['name']) is not schema_class
@@ -1,3 +1,5 @@
+from asgiref.sync import async_to_sync
+
 from django_marshmallow import fields
 from django_marshmallow.schemas import ModelSchema
 from tests.models import DECIMAL_CHOICES
@@ -150,3 +152,97 @@ def test_custom_model_field_deserialization(db, db_models):
     assert len(errors) == 0
     instance = schema.save(save_data)
     assert instance.choices == DECIMAL_CHOICES[1][0]
+
+
+def test_bulk_save(db, db_models, django_assert_num_queries):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    schema = TestSchema()
+    save_data = [{'name': f'Instance {i}', 'text': f'Text {i}'} for i in range(5)]
+
+    # savepoint, release and one insert per batch
+    with django_assert_num_queries(5):
+        instances = schema.save(save_data, many=True, bulk=True, batch_size=2)
+
+    assert len(instances) == 5
+    assert list(db_models.SimpleTestModel.objects.order_by('pk').values_list('name', 'text')) == [
+        (data['name'], data['text']) for data in save_data
+    ]
+
+
+def test_bulk_save_many_to_many_relations(db, db_models):
+    m2m_instances = [
+        db_models.ManyToManyTarget.objects.create(name=f'Many to Many {i}') for i in range(3)
+    ]
+    o2o_instances = [
+        db_models.OneToOneTarget.objects.create(name=f'One to One {i}') for i in range(3)
+    ]
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'many_to_many_field', 'one_to_one_field')
+
+    schema = TestSchema()
+    save_data = [
+        {
+            'name': f'Instance {i}',
+            'one_to_one_field': {'uuid': str(o2o_instances[i].uuid)},
+            'many_to_many_field': [{'uuid': str(m.uuid)} for m in m2m_instances[:i + 1]]
+        }
+        for i in range(3)
+    ]
+    instances = schema.save(save_data, many=True, bulk=True)
+
+    for i, instance in enumerate(instances):
+        assert instance.pk is not None
+        assert set(instance.many_to_many_field.all()) == set(m2m_instances[:i + 1])
+
+
+def test_async_save_and_update(db, db_models):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    schema = TestSchema()
+    save_data = [{'name': f'Instance {i}', 'text': f'Text {i}'} for i in range(3)]
+
+    instances = async_to_sync(schema.asave)(save_data, many=True, bulk=True)
+    assert len(instances) == 3
+    instance = async_to_sync(schema.asave)({'name': 'Instance 3', 'text': 'Text 3'})
+    assert instance.pk is not None
+
+    queryset = db_models.SimpleTestModel.objects.order_by('pk')
+    update_data = [{'text': f'Updated Text {i}'} for i in range(4)]
+    async_to_sync(schema.aupdate)(queryset, update_data, many=True)
+
+    assert list(queryset.values_list('name', 'text')) == [
+        (f'Instance {i}', f'Updated Text {i}') for i in range(4)
+    ]
+
+
+def test_async_orm_save_and_update(db, db_models, async_orm):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    schema = TestSchema()
+    save_data = [{'name': f'Instance {i}', 'text': f'Text {i}'} for i in range(3)]
+
+    instances = async_to_sync(schema.asave)(save_data, many=True, bulk=True)
+    assert [instance.name for instance in instances] == [data['name'] for data in save_data]
+
+    queryset = db_models.SimpleTestModel.objects.order_by('pk')
+    update_data = [{'text': f'Updated Text {i}'} for i in range(3)]
+    async_to_sync(schema.aupdate)(queryset, update_data, many=True)
+
+    assert list(queryset.values_list('name', 'text')) == [
+        (f'Instance {i}', f'Updated Text {i}') for i in range(3)
+    ]
+    # written with `abulk_create` and `abulk_update`
+    assert async_orm == []
@@ -1,10 +1,24 @@
+import json
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
+import pytest
+from asgiref.sync import async_to_sync
+from django.db.models import Prefetch
 from django.forms import model_to_dict
+from django.test import RequestFactory
 
-from django_marshmallow import fields
+from django_marshmallow import fields, schemas
 from django_marshmallow.schemas import ModelSchema
-from tests.models import DECIMAL_CHOICES
+from tests.models import DECIMAL_CHOICES, SimpleTestModel
+
+
+class ParallelTestSchema(ModelSchema):
+    # worker processes import the schema class by its module path
+    class Meta:
+        model = SimpleTestModel
+        fields = ('id', 'name', 'text')
 
 
 def test_schema_serialization_with_all_fields_option(db_models, data_model_obj):
@@ -80,7 +94,55 @@ def test_choices_field_serialization(db, db_models):
     data = schema.dump(basic_choice_obj)
     assert len(data) == 1
     assert data['color']['value'] == 'red'
-    assert data['color']['options'] == list(db_models.BasicChoiceFieldModel.COLOR_CHOICES)
+    assert data['color']['options'] == db_models.BasicChoiceFieldModel.COLOR_CHOICES
+    # options are computed once and shared by all dumped values
+    assert schema.dump(basic_choice_obj)['color']['options'] is data['color']['options']
+
+    # test same schema with the select options in the response envelope
+    class TestSchema(ModelSchema):
+
+        class Meta:
+            model = db_models.BasicChoiceFieldModel
+            fields = ('id', 'color')
+            show_select_options = 'envelope'
+
+    schema = TestSchema()
+    data = schema.dump_envelope([basic_choice_obj, basic_choice_obj], many=True)
+    assert data['data'] == [{'id': basic_choice_obj.id, 'color': 'red'}] * 2
+    assert data['select_options'] == {'color': db_models.BasicChoiceFieldModel.COLOR_CHOICES}
+    assert schema.dump_envelope(basic_choice_obj, only=('id',)) == {
+        'data': {'id': basic_choice_obj.id},
+        'select_options': {}
+    }
+    # immutable options are rendered as JSON arrays
+    assert json.loads(schema.dumps(basic_choice_obj)) == {'id': basic_choice_obj.id, 'color': 'red'}
+    assert json.loads(json.dumps(data['select_options'])) == {
+        'color': [list(choice) for choice in db_models.BasicChoiceFieldModel.COLOR_CHOICES]
+    }
+
+
+def test_nested_choices_field_select_options(db, db_models, settings):
+    settings.MARSHMALLOW_SETTINGS = {'SHOW_SELECT_OPTIONS': 'envelope'}
+    basic_choice_obj = db_models.BasicChoiceFieldModel.objects.create(color='red')
+    simple_obj = db_models.SimpleTestModel.objects.create(name='Instance', text='Text')
+    simple_obj.color_objs = [basic_choice_obj]
+
+    class ColorSchema(ModelSchema):
+        class Meta:
+            model = db_models.BasicChoiceFieldModel
+            fields = ('color',)
+
+    class TestSchema(ModelSchema):
+        colors = fields.RelatedNested(ColorSchema, many=True, attribute='color_objs', dump_only=True)
+
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'colors')
+
+    assert TestSchema().dump_envelope(simple_obj) == {
+        'data': {'name': 'Instance', 'colors': [{'color': 'red'}]},
+        'select_options': {'colors.color': db_models.BasicChoiceFieldModel.COLOR_CHOICES}
+    }
 
 
 def test_file_field_serialization(db_models, file_field_obj):
@@ -137,6 +199,37 @@ def test_file_field_serialization(db_models, file_field_obj):
     )
 
 
+def test_shared_schema_serialization_with_call_values(db_models, file_field_obj, settings):
+    settings.ALLOWED_HOSTS = ['.test']
+
+    class TestSchema(ModelSchema):
+
+        class Meta:
+            model = db_models.FileFieldModel
+            fields = ('name', 'file_field', 'image_field')
+
+    schema = TestSchema(shared=True)
+    file_url = file_field_obj.file_field.url
+
+    def dump_with_request(server_name):
+        request = RequestFactory(SERVER_NAME=server_name).get('/')
+        return schema.dump(file_field_obj, request=request, only=('file_field',))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        server_names = [f'server-{i}.test' for i in range(8)]
+        results = list(executor.map(dump_with_request, server_names))
+
+    for server_name, data in zip(server_names, results):
+        assert data == {'file_field': f'http://{server_name}{file_url}'}
+
+    data = schema.dump(file_field_obj, exclude=('image_field',), domain_for_file_urls='http://test-server')
+    assert data == {'name': file_field_obj.name, 'file_field': urljoin('http://test-server', file_url)}
+
+    # per-call values do not leak into later calls
+    assert schema.dump(file_field_obj)['file_field'] == file_url
+    assert schema.get_scoped_schema(('file_field',)) is schema.get_scoped_schema(['file_field'])
+
+
 def test_schema_serialization_with_related_fields(db_models, all_related_obj):
     """
         Related fields primary keys should return right data types
@@ -286,3 +379,521 @@ def test_unknown_model_field_serialization(db, db_models):
     schema = TestSchema()
     dump_data = schema.dump(model_obj)
     assert dump_data['data'] == json_data
+
+
+def test_queryset_serialization_query_count(db, db_models, django_assert_num_queries):
+    second_depth_instance = db_models.ForeignKeyTarget.objects.create(name='Second level relation')
+    m2m_instances = [
+        db_models.ManyToManyTarget.objects.create(
+            name=f'Many to Many {i}',
+            second_depth_relation_field=second_depth_instance
+        )
+        for i in range(2)
+    ]
+    for i in range(5):
+        obj = db_models.AllRelatedFieldsModel.objects.create(
+            name=f'All related model {i}',
+            foreign_key_field=db_models.ForeignKeyTarget.objects.create(name=f'Foreign Key {i}'),
+            one_to_one_field=db_models.OneToOneTarget.objects.create(name=f'One to One {i}')
+        )
+        obj.many_to_many_field.set(m2m_instances)
+
+    class NestedSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            depth = 2
+
+    class PKSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+
+    queryset = db_models.AllRelatedFieldsModel.objects.all()
+
+    # main query and `many_to_many_field` prefetch query
+    with django_assert_num_queries(2):
+        data = NestedSchema().dump(queryset, many=True)
+
+    assert len(data) == 5
+    assert data[0]['foreign_key_field']['name'] == 'Foreign Key 0'
+    assert data[0]['one_to_one_field']['name'] == 'One to One 0'
+    assert len(data[0]['many_to_many_field']) == 2
+    assert data[0]['many_to_many_field'][0]['second_depth_relation_field']['name'] == 'Second level relation'
+
+    with django_assert_num_queries(2):
+        data = PKSchema().dump(queryset, many=True)
+
+    assert len(data) == 5
+    assert sorted(m['uuid'] for m in data[0]['many_to_many_field']) == sorted(str(m.uuid) for m in m2m_instances)
+
+
+def test_values_queryset_serialization(db, db_models, all_related_obj):
+    db_models.SimpleTestModel.objects.create(name='Instance', text='Text')
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    class RelatedSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'foreign_key_field', 'many_to_many_field')
+            depth = 1
+
+    data = TestSchema().dump(db_models.SimpleTestModel.objects.values('name', 'text'), many=True)
+    assert data == [{'name': 'Instance', 'text': 'Text'}]
+
+    data = RelatedSchema().dump(db_models.AllRelatedFieldsModel.objects.values('name'), many=True)
+    assert data == [{'name': all_related_obj.name}]
+
+
+def test_combined_queryset_serialization(db, db_models):
+    first = db_models.SimpleTestModel.objects.create(name='First', text='Text')
+    second = db_models.SimpleTestModel.objects.create(name='Second', text='Text')
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('id',)
+
+    queryset = db_models.SimpleTestModel.objects.order_by()
+    data = TestSchema().dump(
+        queryset.filter(pk=first.pk).union(queryset.filter(pk=second.pk)).order_by('id'),
+        many=True
+    )
+    assert data == [{'id': first.pk}, {'id': second.pk}]
+
+
+def test_optimized_caller_queryset_serialization(db_models, all_related_obj, django_assert_num_queries):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'foreign_key_field', 'many_to_many_field')
+            depth = 1
+
+    queryset = db_models.AllRelatedFieldsModel.objects.all()
+    expected = TestSchema().dump(queryset, many=True)
+    assert expected[0]['foreign_key_field']['name'] == all_related_obj.foreign_key_field.name
+    assert len(expected[0]['many_to_many_field']) == all_related_obj.many_to_many_field.count()
+
+    # the lookups prefetched by the caller are kept, along with their unspecified ordering
+    with django_assert_num_queries(2):
+        data = TestSchema().dump(queryset.prefetch_related('many_to_many_field'), many=True)
+    data[0]['many_to_many_field'].sort(key=lambda m2m_data: m2m_data['uuid'])
+    assert data == expected
+
+    # combined querysets cannot be optimized
+    data = TestSchema().dump(
+        queryset.filter(pk=all_related_obj.pk).union(queryset.filter(pk=all_related_obj.pk)),
+        many=True
+    )
+    assert data == expected
+
+    # deferred relations are not joined
+    data = TestSchema().dump(queryset.only('name'), many=True)
+    assert data == expected
+    data = TestSchema().dump(queryset.defer('foreign_key_field'), many=True)
+    assert data == expected
+
+
+def test_foreign_key_pk_serialization_from_attname(db_models, all_related_obj, django_assert_num_queries):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'foreign_key_field', 'one_to_one_field')
+            optimize_queries = False
+
+    obj = db_models.AllRelatedFieldsModel.objects.get(pk=all_related_obj.pk)
+
+    # the related rows are not loaded for dumping their primary keys
+    with django_assert_num_queries(0):
+        data = TestSchema().dump(obj)
+
+    assert data['foreign_key_field'] == {'id': all_related_obj.foreign_key_field_id}
+    assert data['one_to_one_field'] == {'uuid': str(all_related_obj.one_to_one_field_id)}
+
+    obj.foreign_key_field = None
+    data = TestSchema().dump(obj)
+    assert data['foreign_key_field'] == {'id': None}
+
+
+def test_many_to_many_pks_collected_from_through_table(db, db_models, django_assert_num_queries):
+    m2m_instances = [
+        db_models.ManyToManyTarget.objects.create(name=f'Many to Many {i}') for i in range(3)
+    ]
+    for i in range(4):
+        obj = db_models.AllRelatedFieldsModel.objects.create(
+            name=f'All related model {i}',
+            one_to_one_field=db_models.OneToOneTarget.objects.create(name=f'One to One {i}')
+        )
+        obj.many_to_many_field.set(m2m_instances[:i])
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'many_to_many_field')
+            collect_m2m_pks = True
+
+    objs = list(db_models.AllRelatedFieldsModel.objects.order_by('pk'))
+
+    # single through table query for all objects
+    with django_assert_num_queries(1):
+        data = TestSchema().dump(objs, many=True)
+
+    for i, item in enumerate(data):
+        assert [m['uuid'] for m in item['many_to_many_field']] == [
+            str(m.uuid) for m in sorted(m2m_instances[:i], key=lambda m: m.uuid)
+        ]
+
+    with django_assert_num_queries(2):
+        queryset_data = TestSchema().dump(db_models.AllRelatedFieldsModel.objects.order_by('pk'), many=True)
+
+    assert queryset_data == data
+
+    class DefaultSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('name', 'many_to_many_field')
+
+    assert DefaultSchema().dump(db_models.AllRelatedFieldsModel.objects.order_by('pk'), many=True) == data
+
+    # prefetched relations are dumped from the prefetch cache
+    prefetched_objs = list(db_models.AllRelatedFieldsModel.objects.order_by('pk').prefetch_related(
+        Prefetch('many_to_many_field', queryset=db_models.ManyToManyTarget.objects.order_by('pk'))
+    ))
+    with django_assert_num_queries(0):
+        assert TestSchema().dump(prefetched_objs, many=True) == data
+
+
+def test_queryset_serialization_column_projection(db, db_models, all_related_obj):
+    class ForeignKeySchema(ModelSchema):
+        class Meta:
+            model = db_models.ForeignKeyTarget
+            fields = ('name',)
+
+    class TestSchema(ModelSchema):
+        foreign_key_field = fields.RelatedNested(ForeignKeySchema)
+
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = ('foreign_key_field', 'one_to_one_field', 'many_to_many_field')
+
+    queryset = TestSchema().prepare_queryset(db_models.AllRelatedFieldsModel.objects.all())
+    sql = str(queryset.query)
+    assert '"tests_allrelatedfieldsmodel"."name"' not in sql
+    assert '"tests_allrelatedfieldsmodel"."one_to_one_field_id"' in sql
+    assert '"tests_foreignkeytarget"."name"' in sql
+    assert '"tests_foreignkeytarget"."active"' not in sql
+
+    data = TestSchema().dump(db_models.AllRelatedFieldsModel.objects.all(), many=True)
+    assert data[0]['foreign_key_field'] == {'name': all_related_obj.foreign_key_field.name}
+    assert len(data[0]['many_to_many_field']) == 2
+
+    # `only` and `exclude` schema parameters are applied to the projection
+    queryset = TestSchema(exclude=('one_to_one_field',)).prepare_queryset(
+        db_models.AllRelatedFieldsModel.objects.all()
+    )
+    assert '"tests_allrelatedfieldsmodel"."one_to_one_field_id"' not in str(queryset.query)
+
+    # schemas dumping non-column attributes are not projected
+    class PropertySchema(ModelSchema):
+        property_method = fields.String()
+
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = ('char_field', 'property_method')
+
+    queryset = PropertySchema().prepare_queryset(db_models.DataFieldsModel.objects.all())
+    assert '"tests_datafieldsmodel"."text_field"' in str(queryset.query)
+
+
+def test_values_serialization(db, db_models, data_model_obj, all_related_obj, django_assert_num_queries):
+    class DataSchema(ModelSchema):
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = '__all__'
+
+    schema = DataSchema()
+    with django_assert_num_queries(1):
+        data = schema.dump_values(db_models.DataFieldsModel.objects.all())
+    assert data == schema.dump(db_models.DataFieldsModel.objects.all(), many=True)
+
+    class RelatedSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+
+    class RelatedPKSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            expand_related_pk_fields = False
+
+    # through table rows in the reverse order of the related primary keys
+    m2m_instances = [
+        db_models.ManyToManyTarget.objects.create(uuid=uuid.UUID(int=i), name=f'Many to Many {i}') for i in range(3)
+    ]
+    all_related_obj.many_to_many_field.clear()
+    for m2m_instance in reversed(m2m_instances):
+        all_related_obj.many_to_many_field.add(m2m_instance)
+
+    for schema in (RelatedSchema(), RelatedPKSchema()):
+        # main query and `many_to_many_field` through table query
+        with django_assert_num_queries(2):
+            data = schema.dump_values(db_models.AllRelatedFieldsModel.objects)
+        assert data == schema.dump(db_models.AllRelatedFieldsModel.objects, many=True)
+        assert data == [schema.dump(all_related_obj)]
+    assert data[0]['many_to_many_field'] == [str(m2m_instance.uuid) for m2m_instance in m2m_instances]
+
+    # nested schemas fall back to model instances
+    class NestedSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            depth = 1
+
+    schema = NestedSchema()
+    assert schema.dump_values(db_models.AllRelatedFieldsModel.objects.all()) == schema.dump(
+        db_models.AllRelatedFieldsModel.objects.all(), many=True
+    )
+
+
+def test_compiled_dump_serialization(db, db_models, data_model_obj, all_related_obj):
+    class DataSchema(ModelSchema):
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = '__all__'
+
+    class CompiledDataSchema(ModelSchema):
+        renamed_field = fields.String(attribute='char_field', data_key='renamed', dump_only=True)
+        decimal_string_field = fields.Decimal(attribute='decimal_field', as_string=True, dump_only=True)
+        method_field = fields.Method(serialize='get_method_field')
+        missing_field = fields.Integer(default=5)
+
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = '__all__'
+            compile_dump = True
+
+        def get_method_field(self, obj):
+            return obj.method()
+
+    schema = CompiledDataSchema()
+    assert schema.compiled_dumper is not None
+    data = schema.dump(data_model_obj)
+    assert data == dict(
+        DataSchema().dump(data_model_obj),
+        renamed=data_model_obj.char_field,
+        decimal_string_field=str(data_model_obj.decimal_field),
+        method_field='method',
+        missing_field=5
+    )
+
+    class RelatedSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            depth = 2
+
+    class CompiledRelatedSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            depth = 2
+            compile_dump = True
+
+    queryset = db_models.AllRelatedFieldsModel.objects.all()
+    assert CompiledRelatedSchema().dump(queryset, many=True) == RelatedSchema().dump(queryset, many=True)
+
+    class CompiledPKSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            compile_dump = True
+
+    data = CompiledPKSchema().dump(all_related_obj)
+    assert data['foreign_key_field'] == {'id': all_related_obj.foreign_key_field_id}
+    assert data['one_to_one_field'] == {'uuid': str(all_related_obj.one_to_one_field_id)}
+
+
+def test_compiled_dumper_cache_size(db_models, settings):
+    settings.MARSHMALLOW_SETTINGS = {'COMPILED_SCHEMA_CACHE_SIZE': 2}
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('id', 'name', 'text')
+            compile_dump = True
+
+    factories = TestSchema._compiled_dumper_factories
+    assert TestSchema(only=('name',)).compiled_dumper is not None
+    TestSchema(only=('text',)).compiled_dumper
+    name_factory = next(iter(factories.values()))
+    TestSchema(only=('name',)).compiled_dumper
+
+    # the least recently used field layout is dropped
+    TestSchema(only=('id',)).compiled_dumper
+    assert len(factories) == 2
+    assert name_factory in factories.values()
+
+    obj = db_models.SimpleTestModel(id=1, name='Name', text='Text')
+    assert TestSchema(only=('text',)).dump(obj) == {'text': 'Text'}
+
+
+def test_queryset_stream_serialization(db, db_models, django_assert_num_queries):
+    fk_instance = db_models.ForeignKeyTarget.objects.create(name='Foreign Key')
+    m2m_instances = [db_models.ManyToManyTarget.objects.create(name=f'Many to Many {i}') for i in range(2)]
+    for i in range(5):
+        instance = db_models.SimpleRelationsModel.objects.create(foreign_key_field=fk_instance)
+        instance.many_to_many_field.set(m2m_instances[:i % 2 + 1])
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleRelationsModel
+            fields = '__all__'
+            depth = 1
+            order_by = ('id',)
+
+    schema = TestSchema()
+
+    # main query and one `many_to_many_field` prefetch query per chunk
+    with django_assert_num_queries(4):
+        chunks = list(schema.dump_stream(db_models.SimpleRelationsModel.objects, chunk_size=2))
+
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert json.loads(b''.join(chunks)) == schema.dump(db_models.SimpleRelationsModel.objects, many=True)
+    assert b''.join(schema.dump_stream(db_models.SimpleRelationsModel.objects.none())) == b'[]'
+
+    async def collect_chunks(queryset):
+        return [chunk async for chunk in schema.adump_stream(queryset, chunk_size=2)]
+
+    async_chunks = async_to_sync(collect_chunks)(db_models.SimpleRelationsModel.objects)
+    assert async_chunks == chunks
+    assert async_to_sync(collect_chunks)(db_models.SimpleRelationsModel.objects.none()) == [b'[', b']']
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_bytes_serialization(db, db_models, data_model_obj, all_related_obj, monkeypatch, use_orjson):
+    if use_orjson:
+        assert schemas.orjson is not None
+    else:
+        # the schema render module encodes and decodes without orjson
+        monkeypatch.setattr(schemas, 'orjson', None)
+
+    class DataSchema(ModelSchema):
+        class Meta:
+            model = db_models.DataFieldsModel
+            fields = '__all__'
+
+    class RelatedSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            depth = 1
+
+    for schema, queryset in (
+        (DataSchema(), db_models.DataFieldsModel.objects.all()),
+        (RelatedSchema(), db_models.AllRelatedFieldsModel.objects.all()),
+    ):
+        expected = json.loads(json.dumps(schema.dump(queryset, many=True), default=str))
+        for native_types in (True, False):
+            encoded = schema.dumps_bytes(queryset, many=True, native_types=native_types)
+            assert isinstance(encoded, bytes)
+            assert json.loads(encoded) == expected
+
+        encoded = schema.dumps_bytes(queryset, many=True, ndjson=True)
+        assert [json.loads(line) for line in encoded.splitlines()] == expected
+
+    # date and time values are left to the encoder
+    native_data = DataSchema().compiled_native_dumper(data_model_obj)
+    assert native_data['datetime_field'] is data_model_obj.datetime_field
+
+    schema = DataSchema(only=('char_field', 'integer_field'))
+    assert schema.loads_bytes(b'{"char_field": "Char Field", "integer_field": 2}') == {
+        'char_field': 'Char Field',
+        'integer_field': 2
+    }
+
+
+@pytest.mark.parametrize('ordered', [True, False])
+def test_parallel_serialization(transactional_db, db_models, ordered):
+    for i in range(7):
+        db_models.SimpleTestModel.objects.create(name=f'Instance {i}', text=f'Text {i}')
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('id', 'name', 'text')
+
+    schema = TestSchema()
+    queryset = db_models.SimpleTestModel.objects.exclude(name='Instance 3')
+    expected = schema.dump(queryset.order_by('pk'), many=True)
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        data = json.loads(b''.join(schema.parallel_dump(queryset, chunk_size=2, ordered=ordered, executor=executor)))
+        lines = b''.join(
+            schema.parallel_dump(queryset, chunk_size=3, ordered=ordered, ndjson=True, executor=executor)
+        ).splitlines()
+
+    if not ordered:
+        data.sort(key=lambda item: item['id'])
+    assert data == expected
+    assert sorted((json.loads(line) for line in lines), key=lambda item: item['id']) == expected
+
+    with pytest.raises(ValueError):
+        list(schema.parallel_dump(queryset))
+
+
+def test_parallel_process_serialization(file_db):
+    for i in range(7):
+        SimpleTestModel.objects.create(name=f'Instance {i}', text=f'Text {i}')
+
+    schema = ParallelTestSchema()
+    queryset = SimpleTestModel.objects.exclude(name='Instance 3')
+    expected = schema.dump(queryset.order_by('pk'), many=True)
+
+    data = json.loads(b''.join(schema.parallel_dump(queryset, chunk_size=2, workers=2)))
+    assert data == expected
+
+    lines = b''.join(schema.parallel_dump(queryset, chunk_size=4, workers=2, ordered=False, ndjson=True))
+    assert sorted((json.loads(line) for line in lines.splitlines()), key=lambda item: item['id']) == expected
+
+
+def test_async_serialization(db, db_models, all_related_obj):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            depth = 1
+
+    schema = TestSchema()
+    queryset = db_models.AllRelatedFieldsModel.objects.all()
+
+    assert async_to_sync(schema.adump)(queryset, many=True) == schema.dump(queryset, many=True)
+    assert async_to_sync(schema.adump)(all_related_obj, only=('name',)) == {'name': all_related_obj.name}
+
+
+def test_async_orm_serialization(db, db_models, all_related_obj, async_orm):
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.AllRelatedFieldsModel
+            fields = '__all__'
+            depth = 1
+
+    schema = TestSchema()
+    queryset = db_models.AllRelatedFieldsModel.objects.all()
+    expected = schema.dump(queryset, many=True)
+
+    assert async_to_sync(schema.adump)(queryset, many=True) == expected
+    assert async_orm == []
+
+    async def collect_chunks(queryset):
+        return [chunk async for chunk in schema.adump_stream(queryset, chunk_size=1)]
+
+    chunks = async_to_sync(collect_chunks)(queryset)
+    assert chunks == list(schema.dump_stream(queryset, chunk_size=1))
+    assert json.loads(b''.join(chunks)) == expected
+    # only the prefetch queries of every chunk run in a thread
+    assert set(async_orm) == {'prefetch_related_objects'}
@@ -81,7 +81,7 @@ def test_show_select_options_settings(db, db_models):
         data = schema.dump(basic_choice_obj)
         assert len(data) == 1
         assert data['color']['value'] == 'blue'
-        assert data['color']['options'] == list(db_models.BasicChoiceFieldModel.COLOR_CHOICES)
+        assert data['color']['options'] == db_models.BasicChoiceFieldModel.COLOR_CHOICES
 
 
 def test_datetime_format_settings(db_models, data_model_obj):
@@ -58,3 +58,86 @@ def test_schema_update_with_invalid_data(db_models, data_model_obj):
         schema.update(data_model_obj, validated_data=update_data)
 
     assert 'Not a valid email address' in str(excinfo.value)
+
+
+def test_schema_bulk_update_changed_fields(db, db_models, django_assert_num_queries):
+    instances = [
+        db_models.SimpleTestModel.objects.create(name=f'Instance {i}', text=f'Text {i}') for i in range(4)
+    ]
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    update_data = [
+        {'name': 'Updated 0'},
+        {'name': 'Updated 1', 'text': 'Text 1'},
+        {'name': 'Instance 2', 'text': 'Text 2'},
+        {'text': 'Updated 3'},
+    ]
+
+    schema = TestSchema()
+    queryset = db_models.SimpleTestModel.objects.order_by('pk')
+
+    # the queryset, savepoint, release and one update per set of changed fields
+    with django_assert_num_queries(5):
+        updated_objs = schema.update(queryset, validated_data=update_data, many=True)
+
+    assert [(obj.name, obj.text) for obj in updated_objs] == [
+        ('Updated 0', 'Text 0'),
+        ('Updated 1', 'Text 1'),
+        ('Instance 2', 'Text 2'),
+        ('Instance 3', 'Updated 3'),
+    ]
+    assert list(queryset.values_list('name', 'text')) == [(obj.name, obj.text) for obj in updated_objs]
+
+    with pytest.raises(ValueError):
+        schema.update(instances[:1], validated_data=update_data, many=True)
+
+
+def test_schema_partial_update_fields(db, db_models, django_assert_num_queries):
+    instance = db_models.SimpleTestModel.objects.create(name='Instance', text='Text')
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = ('name', 'text')
+
+    schema = TestSchema()
+
+    with django_assert_num_queries(1) as captured:
+        schema.update(instance, validated_data={'name': 'Updated'})
+
+    update_sql = captured.captured_queries[0]['sql']
+    assert '"name"' in update_sql
+    assert '"text"' not in update_sql
+    assert db_models.SimpleTestModel.objects.get(pk=instance.pk).name == 'Updated'
+
+    # unchanged values are not written
+    with django_assert_num_queries(0):
+        schema.update(instance, validated_data={'name': 'Updated', 'text': 'Text'})
+
+
+def test_schema_partial_update_with_primary_key(db, db_models):
+    instance = db_models.SimpleTestModel.objects.create(name='Instance', text='Text')
+    m2m_instance = db_models.ManyToManyTarget.objects.create(name='Many to Many')
+
+    class TestSchema(ModelSchema):
+        class Meta:
+            model = db_models.SimpleTestModel
+            fields = '__all__'
+
+    class UUIDTestSchema(ModelSchema):
+        class Meta:
+            model = db_models.ManyToManyTarget
+            fields = '__all__'
+
+    TestSchema().update(instance, validated_data={'id': instance.id, 'name': 'Updated'})
+    assert db_models.SimpleTestModel.objects.get(pk=instance.pk).name == 'Updated'
+
+    UUIDTestSchema().update(m2m_instance, validated_data={'uuid': str(m2m_instance.uuid), 'name': 'Updated'})
+    assert db_models.ManyToManyTarget.objects.get(pk=m2m_instance.pk).name == 'Updated'
+
+    TestSchema().update([instance], validated_data=[{'id': instance.id, 'text': 'Updated'}], many=True)
+    assert db_models.SimpleTestModel.objects.get(pk=instance.pk).text == 'Updated'
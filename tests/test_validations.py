@@ -1,5 +1,8 @@
 import uuid
 
+import pytest
+from marshmallow import ValidationError
+
 from django_marshmallow import fields
 from django_marshmallow.schemas import ModelSchema
 
@@ -519,6 +522,22 @@ def test_choices_field_validation(db_models):
     assert len(errors) == 0
 
 
+def test_choice_validator():
+    validator = fields.ChoiceValidator(choices=['red', 'blue'], labels=['Red', 'Blue'])
+    assert validator('red') == 'red'
+    # error message texts are built on the first failure
+    assert 'choices_text' not in validator.__dict__
+
+    for value in ('orange', ['red'], {'red': 1}):
+        with pytest.raises(ValidationError) as exc_info:
+            validator(value)
+        assert exc_info.value.messages == ['Must be one of: red, blue.']
+
+    validator = fields.ChoiceValidator(choices=[['red'], 'blue'])
+    assert validator(['red']) == ['red']
+    assert list(validator.options()) == [("['red']", ''), ('blue', '')]
+
+
 def test_django_model_field_validators_validation(db_models):
 
     class TestSchema(ModelSchema):